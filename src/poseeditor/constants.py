@@ -4,13 +4,14 @@ DIR_ORIGIN = "images"  # 原图
 DIR_JSON = "annotations"  # 标注JSON
 DIR_INPAINT = "inpainting"  # inpainting参考图
 META_FILE = "meta.json"  # 项目元数据
+INDEX_FILE = ".image_index.json"  # 原图目录的文件名索引缓存
 APP_VERSION = "4.0.0"
 
-# 主图扫描支持的扩展名。
-IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp", ".tiff")
+# 主图扫描支持的扩展名（小写，扫描目录时逐个文件做成员判断）。
+IMAGE_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".bmp", ".tiff"})
 
 # 补绘参考图支持的扩展名。
-INPAINT_EXTENSIONS = IMAGE_EXTENSIONS + (".webp",)
+INPAINT_EXTENSIONS = IMAGE_EXTENSIONS | {".webp"}
 
 # 界面里展示并绑定快捷键的预设忽略类别。
 IGNORE_CATEGORIES = ("美感不足", "难以补全", "背景失真", "比例失调", "图像模糊")
@@ -0,0 +1,54 @@
+"""标注与元数据文件的 JSON 读写。"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，未安装时回退到标准库。
+    orjson = None
+
+PathLike = Union[str, Path]
+
+
+def dumps(obj: Any) -> bytes:
+    """序列化为两空格缩进、不转义非 ASCII 字符的 UTF-8 字节串。"""
+    if orjson is not None:
+        # 与标准库一致，允许非字符串键（转为字符串输出）。
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def loads(data: bytes) -> Any:
+    """解析 UTF-8 编码的 JSON 字节串。"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def read_json(path: PathLike) -> Any:
+    """整块读取文件后一次性解析。"""
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def write_bytes_atomic(path: PathLike, data: bytes) -> None:
+    """先写入同目录的临时文件再替换目标，中途崩溃不会留下半截文件。"""
+    tmp_path = os.fspath(path) + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def write_json(path: PathLike, obj: Any) -> None:
+    """先在内存中序列化，再一次性原子写入文件。"""
+    write_bytes_atomic(path, dumps(obj))
@@ -1,16 +1,20 @@
 """主窗口与项目工作流。"""
 
+import errno
 import getpass
-import json
+import os
 import shutil
 import time
 import zipfile
+from collections import OrderedDict
 from datetime import datetime
+from functools import partial
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
-from PySide6.QtCore import QEvent, Qt
-from PySide6.QtGui import QAction, QImage, QKeyEvent, QKeySequence, QPixmap, QShortcut
+from PySide6.QtCore import QModelIndex, Qt, QThreadPool, QTimer
+from PySide6.QtGui import QAction, QKeySequence, QPixmap, QShortcut
 from PySide6.QtWidgets import (
     QButtonGroup,
     QDialog,
@@ -21,10 +25,10 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QInputDialog,
     QLabel,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QMainWindow,
     QMessageBox,
+    QProgressDialog,
     QPushButton,
     QScrollArea,
     QSizePolicy,
@@ -41,18 +45,99 @@ from .constants import (
     DIR_ORIGIN,
     IGNORE_CATEGORIES,
     IMAGE_EXTENSIONS,
+    INDEX_FILE,
     INPAINT_EXTENSIONS,
     META_FILE,
 )
+from .jsonio import dumps, loads, read_json, write_json
 from .models import PoseData
+from .prefetch import (
+    AnnotationScanner,
+    ImagePrefetcher,
+    ScanSignals,
+    decode_image,
+    decode_image_to_fit,
+)
 from .widgets.canvas import Canvas
+from .writer import JsonWriter
+from .widgets.keypoint_list import KeypointListModel
 from .widgets.tooltip import DelayedTooltipFilter
 
 
+# 状态栏中的可见性文字，按 visibility == 1 取值；COCO 数据中的其他取值按遮挡显示。
+_VIS_LABELS = ("遮挡", "可见")
+
+# 丢弃理由的数字快捷键，按 IGNORE_CATEGORIES 的顺序依次对应。
+_DIGIT_KEYS = (
+    Qt.Key_1,
+    Qt.Key_2,
+    Qt.Key_3,
+    Qt.Key_4,
+    Qt.Key_5,
+    Qt.Key_6,
+    Qt.Key_7,
+    Qt.Key_8,
+    Qt.Key_9,
+)
+
+
+def _ext_of(name: str) -> str:
+    """返回小写扩展名（含点），无扩展名或隐藏文件名返回空字符串。"""
+    i = name.rfind(".")
+    return name[i:].lower() if i > 0 else ""
+
+
+def _iter_image_entries(folder: Path, extensions=IMAGE_EXTENSIONS):
+    """单次 scandir 遍历目录，产出扩展名受支持的图片文件条目。"""
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            # DirEntry.is_file() 复用目录读取时得到的类型信息，通常无需额外 stat。
+            if _ext_of(entry.name) in extensions and entry.is_file():
+                yield entry
+
+
+def _move_file(src: Path, dst: Path):
+    """移动文件：同一文件系统内直接重命名，跨设备时回退到复制后删除。"""
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(str(src), str(dst))
+
+
+def _pose_from_annotation(data) -> PoseData:
+    """标注文件内容可能是记录列表或单条记录，取第一条记录构造姿态。"""
+    if isinstance(data, list):
+        return PoseData.from_dict(data[0]) if data else PoseData()
+    if data is not None:
+        return PoseData.from_dict(data)
+    return PoseData()
+
+
+def _annotation_needs_processing(data) -> bool:
+    return _pose_from_annotation(data).needs_processing()
+
+
 class PoseEditor(QMainWindow):
+    # meta.json 修改后等待该时长再写盘，期间的多次修改合并为一次写入。
+    META_FLUSH_DELAY_MS = 500
+    # 扫描原图目录时每批处理的条目数，批次之间让出事件循环。
+    IMAGE_SCAN_BATCH = 1000
+    # 原图目录修改时间至少早于当前这么久才写入索引（纳秒）。
+    INDEX_MIN_AGE_NS = 2_000_000_000
+    # meta.json 中保留的打开记录条数。
+    OPEN_HISTORY_LIMIT = 50
+    # 标注读取缓存的最大条目数。
+    ANNOTATION_CACHE_SIZE = 256
+    # inpainting 预览缓存的最大条目数。
+    INPAINT_CACHE_SIZE = 32
+
     def __init__(self):
         super().__init__()
         self.current_image_path = None
+        # 与 current_image_path 对应的 Path 对象，避免各处重复构造。
+        self._current_path: Optional[Path] = None
         self.current_annotation_path = None
         self.image_files = []
         self.current_index = 0
@@ -64,9 +149,58 @@ class PoseEditor(QMainWindow):
         self.json_dir = None  # annotations/
         self.inpaint_dir = None  # inpainting/
 
+        # meta.json 的内存副本；修改后延迟合并写盘，翻页时不必每次读写文件。
+        self._meta: dict = {}
+        self._meta_path: Optional[Path] = None
+        self._meta_dirty = False
+        self._meta_flush_timer = QTimer(self)
+        self._meta_flush_timer.setSingleShot(True)
+        self._meta_flush_timer.setInterval(self.META_FLUSH_DELAY_MS)
+        self._meta_flush_timer.timeout.connect(self._flush_meta)
+
+        # 已解析的标注，标注路径 -> (mtime_ns, 文件大小, 数据)；文件未变化时来回翻页直接复用。
+        self._annotation_cache: "OrderedDict[str, tuple[int, int, object]]" = (
+            OrderedDict()
+        )
+
+        # 打开项目时扫描一次标注目录得到的已存在标注文件，及图片到标注路径的解析结果。
+        self._annotation_files: Optional[set[str]] = None
+        self._annotation_dir: Optional[str] = None
+        # 标注目录之外（旧结构下与图片同目录）的标注文件是否存在，首次查询时检查。
+        self._sidecar_exists: dict[str, bool] = {}
+        self._annotation_path_cache: dict[str, Path] = {}
+        # inpainting 参考图索引（文件名主干 -> 路径），首次查找时建立。
+        self._inpaint_index: Optional[dict[str, Path]] = None
+        # 已缩放到预览尺寸的参考图，(文件名主干, 宽, 高) -> QPixmap，来回翻页时直接复用。
+        self._inpaint_cache: "OrderedDict[tuple[str, int, int], QPixmap]" = OrderedDict()
+        # 图片路径 -> 是否仍需处理，供“下一个未完成”跳转时免去解码图片。
+        self._needs_processing: dict[str, bool] = {}
+        # 打开项目后在后台预先填充上述状态，批次号用于丢弃过期结果。
+        self._status_scanner: Optional[AnnotationScanner] = None
+        self._status_scan_generation = 0
+        self._scan_signals = ScanSignals(self)
+        self._scan_signals.finished.connect(self._on_status_scan_finished)
+
+        # 分批扫描原图目录的状态，批次号用于丢弃已被新项目取代的扫描。
+        self._image_scan_entries = None
+        self._image_scan_found: list[Path] = []
+        self._image_scan_generation = 0
+
         # 新增评分和跳过按钮的引用
         self.score_buttons = {}
         self.skip_buttons = []
+        self._secondary_panel_built = False
+        # 待执行的合并刷新，见 _schedule_refresh。
+        self._refresh_pending = False
+        self._refresh_list_pending = False
+
+        self.prefetcher = ImagePrefetcher(parent=self)
+        # 标注文件在后台按顺序写入。
+        self.annotation_writer = JsonWriter(self)
+        self.annotation_writer.written.connect(self._on_annotation_written)
+        self.annotation_writer.failed.connect(self._on_annotation_write_failed)
+        # 写入中的标注路径 -> 图片路径，写完后据此丢弃过期的预读结果。
+        self._writing_annotations: dict[str, str] = {}
 
         self.init_ui()
 
@@ -83,6 +217,7 @@ class PoseEditor(QMainWindow):
 
         self.canvas = Canvas()
         self.canvas.keypoint_selected.connect(self.on_keypoint_selected)
+        self.canvas.keypoint_changed.connect(self.refresh_keypoint_row)
         splitter.addWidget(self.canvas)
 
         control_panel = self.create_control_panel()
@@ -119,7 +254,7 @@ class PoseEditor(QMainWindow):
 
         self.save_btn = QPushButton("💾 保存")
         self.save_btn.setToolTip("Ctrl+S")
-        self.save_btn.clicked.connect(self.save_current)
+        self.save_btn.clicked.connect(self.save_now)
         proj_row1.addWidget(self.save_btn)
 
         self.export_btn = QPushButton("📦 导出")
@@ -172,13 +307,32 @@ class PoseEditor(QMainWindow):
 
         # --- 关键点列表（全宽，限高） ---
         layout.addWidget(QLabel("关键点列表:"))
-        self.keypoint_list = QListWidget()
+        self.keypoint_model = KeypointListModel(self)
+        self.keypoint_list = QListView()
+        self.keypoint_list.setModel(self.keypoint_model)
+        # 各行高度一致，布局时无需逐行测量尺寸。
+        self.keypoint_list.setUniformItemSizes(True)
         self.keypoint_list.setMaximumHeight(160)
         self.keypoint_list.setStyleSheet("font-size: 11px;")
-        self.keypoint_list.itemClicked.connect(self.on_list_item_clicked)
+        self.keypoint_list.clicked.connect(self.on_list_item_clicked)
         layout.addWidget(self.keypoint_list)
         self.update_keypoint_list()
 
+        # 其余分组在窗口首次显示后再创建，见 _build_secondary_panel。
+        self._control_layout = layout
+        return panel
+
+    def _build_secondary_panel(self):
+        """创建 Ignore、评分与 inpainting 预览分组，追加到控制面板末尾。
+
+        首帧只需要画布与导航按钮，这些分组推迟到窗口显示后的下一轮事件循环；
+        打开项目前也会调用一次，重复调用直接返回。
+        """
+        if self._secondary_panel_built:
+            return
+        self._secondary_panel_built = True
+        layout = self._control_layout
+
         # --- 移至 Ignore ---
         skip_group = QGroupBox("移至 Ignore（不可撤销）")
         skip_layout_top = QHBoxLayout()
@@ -190,197 +344,53 @@ class PoseEditor(QMainWindow):
         skip_group_layout.addLayout(skip_layout_top)
         skip_group_layout.addLayout(skip_layout_bottom)
 
-        ignore_btn_style = """
+        # 样式表只在分组上设置一次，组内按钮共享同一份解析结果。
+        skip_group.setStyleSheet("""
             QPushButton {
                 background-color: #fff3cd; border: 1px solid #ffc107;
                 padding: 8px 12px; color: #856404; font-size: 13px; font-weight: bold;
                 min-height: 30px;
             }
             QPushButton:hover { background-color: #ffc107; color: white; }
-        """
-
-        self.ignore_aesthetic_btn = QPushButton("1.美感不足")
-        self.ignore_aesthetic_btn.setToolTip(
-            "1 | 美感不足。如果图像不是具有美感的人物照片（例如日常照片），则可点击该按钮跳过。"
-        )
-        self.ignore_aesthetic_btn.clicked.connect(
-            lambda: self.move_to_ignore_category("美感不足")
-        )
-        self.ignore_aesthetic_btn.setStyleSheet(ignore_btn_style)
-        skip_layout_top.addWidget(self.ignore_aesthetic_btn)
-
-        self.ignore_incomplete_btn = QPushButton("2.难以补全")
-        self.ignore_incomplete_btn.setToolTip(
-            "2 | 难以补全。如果图像中的人物下半身都在画面外，难以拖拽画面外的遮挡点到猜测位置，则点它跳过。"
-        )
-        self.ignore_incomplete_btn.clicked.connect(
-            lambda: self.move_to_ignore_category("难以补全")
-        )
-        self.ignore_incomplete_btn.setStyleSheet(ignore_btn_style)
-        skip_layout_top.addWidget(self.ignore_incomplete_btn)
-
-        self.ignore_scene_btn = QPushButton("3.背景失真")
-        self.ignore_scene_btn.setToolTip(
-            "3 | 背景失真。这里的图像是将人物图像中的人物区域给删除修复得到的无人场景图。如果该图像有异常纹理等不真实的情况，则点它跳过。"
-        )
-        self.ignore_scene_btn.clicked.connect(
-            lambda: self.move_to_ignore_category("背景失真")
-        )
-        self.ignore_scene_btn.setStyleSheet(ignore_btn_style)
-        skip_layout_top.addWidget(self.ignore_scene_btn)
-
-        self.ignore_size_btn = QPushButton("4.比例失调")
-        self.ignore_size_btn.setToolTip(
-            "4 | 比例失调。如果人物占画面的比例非常小或大，无法确定姿态，则点它跳过。"
-        )
-        self.ignore_size_btn.clicked.connect(
-            lambda: self.move_to_ignore_category("比例失调")
-        )
-        self.ignore_size_btn.setStyleSheet(ignore_btn_style)
-        skip_layout_bottom.addWidget(self.ignore_size_btn)
+        """)
 
-        self.ignore_blur_btn = QPushButton("5.图像模糊")
-        self.ignore_blur_btn.setToolTip(
-            "5 | 图像模糊。如果图像分辨率很低，或图像质量不佳，则可点它跳过。"
-        )
-        self.ignore_blur_btn.clicked.connect(
-            lambda: self.move_to_ignore_category("图像模糊")
+        # 提示文本集中保存在类级字典中，悬停显示时才按类别查询。
+        self.tooltip_filter = DelayedTooltipFilter(
+            self,
+            text_provider=lambda btn: self._IGNORE_TOOLTIPS[btn.property("category")],
         )
-        self.ignore_blur_btn.setStyleSheet(ignore_btn_style)
-        skip_layout_bottom.addWidget(self.ignore_blur_btn)
-        self.skip_buttons = [
-            self.ignore_aesthetic_btn,
-            self.ignore_incomplete_btn,
-            self.ignore_scene_btn,
-            self.ignore_size_btn,
-            self.ignore_blur_btn,
-        ]
+        self.skip_buttons = []
+        for idx, category in enumerate(IGNORE_CATEGORIES, start=1):
+            btn = QPushButton(f"{idx}.{category}")
+            btn.setProperty("category", category)
+            btn.clicked.connect(partial(self.move_to_ignore_category, category))
+            btn.installEventFilter(self.tooltip_filter)
+            # 前三个按钮放在第一行，其余放在第二行。
+            row = skip_layout_top if idx <= 3 else skip_layout_bottom
+            row.addWidget(btn)
+            self.skip_buttons.append(btn)
 
         layout.addWidget(skip_group)
 
-        # 安装延迟工具提示过滤器
-        self.tooltip_filter = DelayedTooltipFilter(self)
-        for btn in [
-            self.ignore_aesthetic_btn,
-            self.ignore_incomplete_btn,
-            self.ignore_scene_btn,
-            self.ignore_size_btn,
-            self.ignore_blur_btn,
-        ]:
-            btn.installEventFilter(self.tooltip_filter)
-
         # --- 评分系统（支持 N/A 未评分状态，按钮更大） ---
         score_group = QGroupBox("姿态评分")
+        score_group.setStyleSheet(self._SCORE_STYLE)
         score_layout = QVBoxLayout(score_group)
         score_layout.setSpacing(4)
 
-        score_btn_size = 36  # 放大的按钮尺寸
-
         detail_layout = QGridLayout()
         detail_layout.setSpacing(3)
 
-        # 姿势新奇度
-        novelty_label_w = QWidget()
-        novelty_label_l = QHBoxLayout(novelty_label_w)
-        novelty_label_l.setContentsMargins(0, 0, 0, 0)
-        novelty_label_l.setSpacing(2)
-        novelty_label_l.addWidget(QLabel("姿势新奇度:"))
-        novelty_help_btn = QPushButton("?")
-        novelty_help_btn.setFixedSize(20, 20)
-        novelty_help_btn.setStyleSheet("QPushButton { font-size: 11px; font-weight: bold; border: 1px solid #aaa; border-radius: 10px; background: #e8e8e8; } QPushButton:hover { background: #d0d0d0; }")
-        novelty_help_btn.clicked.connect(lambda: self._show_score_help("novelty"))
-        novelty_label_l.addWidget(novelty_help_btn)
-        novelty_label_l.addStretch()
-        detail_layout.addWidget(novelty_label_w, 0, 0)
-        self.novelty_buttons = {}
-        self.novelty_btn_group = QButtonGroup(self)
-        self.novelty_btn_group.setExclusive(False)
-        self.novelty_btn_group.buttonClicked.connect(
-            lambda btn: self._on_exclusive_score_click(
-                self.novelty_btn_group, "novelty", btn
-            )
+        self.novelty_btn_group, self.novelty_buttons = self._build_score_row(
+            detail_layout, 0, "姿势新奇度:", "novelty", "novelty_btn"
         )
-
-        for i in range(6):
-            btn = QPushButton(str(i))
-            btn.setCheckable(True)
-            btn.setFixedSize(score_btn_size, score_btn_size)
-            btn.setStyleSheet("""
-                QPushButton { background-color: #f0f0f0; border: 1px solid #ccc; font-size: 13px; font-weight: bold; }
-                QPushButton:checked { background-color: #28a745; color: white; border: 2px solid #1e7e34; }
-            """)
-            self.novelty_btn_group.addButton(btn, i)
-            detail_layout.addWidget(btn, 0, i + 1)
-            self.novelty_buttons[i] = btn
-
-        # 环境互动性
-        env_label_w = QWidget()
-        env_label_l = QHBoxLayout(env_label_w)
-        env_label_l.setContentsMargins(0, 0, 0, 0)
-        env_label_l.setSpacing(2)
-        env_label_l.addWidget(QLabel("环境互动性:"))
-        env_help_btn = QPushButton("?")
-        env_help_btn.setFixedSize(20, 20)
-        env_help_btn.setStyleSheet("QPushButton { font-size: 11px; font-weight: bold; border: 1px solid #aaa; border-radius: 10px; background: #e8e8e8; } QPushButton:hover { background: #d0d0d0; }")
-        env_help_btn.clicked.connect(lambda: self._show_score_help("environment_interaction"))
-        env_label_l.addWidget(env_help_btn)
-        env_label_l.addStretch()
-        detail_layout.addWidget(env_label_w, 1, 0)
-        self.env_buttons = {}
-        self.env_btn_group = QButtonGroup(self)
-        self.env_btn_group.setExclusive(False)
-        self.env_btn_group.buttonClicked.connect(
-            lambda btn: self._on_exclusive_score_click(
-                self.env_btn_group, "environment_interaction", btn
-            )
+        self.env_btn_group, self.env_buttons = self._build_score_row(
+            detail_layout, 1, "环境互动性:", "environment_interaction", "env_btn"
         )
-
-        for i in range(6):
-            btn = QPushButton(str(i))
-            btn.setCheckable(True)
-            btn.setFixedSize(score_btn_size, score_btn_size)
-            btn.setStyleSheet("""
-                QPushButton { background-color: #f0f0f0; border: 1px solid #ccc; font-size: 13px; font-weight: bold; }
-                QPushButton:checked { background-color: #17a2b8; color: white; border: 2px solid #117a8b; }
-            """)
-            self.env_btn_group.addButton(btn, i)
-            detail_layout.addWidget(btn, 1, i + 1)
-            self.env_buttons[i] = btn
-
-        # 人物契合度
-        person_label_w = QWidget()
-        person_label_l = QHBoxLayout(person_label_w)
-        person_label_l.setContentsMargins(0, 0, 0, 0)
-        person_label_l.setSpacing(2)
-        person_label_l.addWidget(QLabel("人物契合度:"))
-        person_help_btn = QPushButton("?")
-        person_help_btn.setFixedSize(20, 20)
-        person_help_btn.setStyleSheet("QPushButton { font-size: 11px; font-weight: bold; border: 1px solid #aaa; border-radius: 10px; background: #e8e8e8; } QPushButton:hover { background: #d0d0d0; }")
-        person_help_btn.clicked.connect(lambda: self._show_score_help("person_fit"))
-        person_label_l.addWidget(person_help_btn)
-        person_label_l.addStretch()
-        detail_layout.addWidget(person_label_w, 2, 0)
-        self.person_buttons = {}
-        self.person_btn_group = QButtonGroup(self)
-        self.person_btn_group.setExclusive(False)
-        self.person_btn_group.buttonClicked.connect(
-            lambda btn: self._on_exclusive_score_click(
-                self.person_btn_group, "person_fit", btn
-            )
+        self.person_btn_group, self.person_buttons = self._build_score_row(
+            detail_layout, 2, "人物契合度:", "person_fit", "person_btn"
         )
 
-        for i in range(6):
-            btn = QPushButton(str(i))
-            btn.setCheckable(True)
-            btn.setFixedSize(score_btn_size, score_btn_size)
-            btn.setStyleSheet("""
-                QPushButton { background-color: #f0f0f0; border: 1px solid #ccc; font-size: 13px; font-weight: bold; }
-                QPushButton:checked { background-color: #ffc107; color: black; border: 2px solid #d39e00; }
-            """)
-            self.person_btn_group.addButton(btn, i)
-            detail_layout.addWidget(btn, 2, i + 1)
-            self.person_buttons[i] = btn
-
         score_layout.addLayout(detail_layout)
         layout.addWidget(score_group)
 
@@ -413,7 +423,62 @@ class PoseEditor(QMainWindow):
 
         layout.addWidget(inpaint_group)
 
-        return panel
+    # 评分分组的样式表：三行评分按钮通过对象名区分选中颜色，整组只解析一次。
+    _SCORE_STYLE = """
+        QPushButton#novelty_btn, QPushButton#env_btn, QPushButton#person_btn {
+            background-color: #f0f0f0; border: 1px solid #ccc; font-size: 13px; font-weight: bold;
+        }
+        QPushButton#novelty_btn:checked { background-color: #28a745; color: white; border: 2px solid #1e7e34; }
+        QPushButton#env_btn:checked { background-color: #17a2b8; color: white; border: 2px solid #117a8b; }
+        QPushButton#person_btn:checked { background-color: #ffc107; color: black; border: 2px solid #d39e00; }
+        QPushButton#score_help_btn {
+            font-size: 11px; font-weight: bold; border: 1px solid #aaa; border-radius: 10px; background: #e8e8e8;
+        }
+        QPushButton#score_help_btn:hover { background: #d0d0d0; }
+    """
+
+    SCORE_BUTTON_SIZE = 36  # 放大的评分按钮尺寸
+
+    def _build_score_row(
+        self,
+        grid: QGridLayout,
+        row: int,
+        label: str,
+        score_key: str,
+        object_name: str,
+    ) -> tuple[QButtonGroup, dict[int, QPushButton]]:
+        """在 grid 的第 row 行创建“标签 + ? + 0~5 分”一行评分按钮。
+
+        按钮样式由评分分组的样式表按 object_name 统一提供。
+        """
+        label_w = QWidget()
+        label_l = QHBoxLayout(label_w)
+        label_l.setContentsMargins(0, 0, 0, 0)
+        label_l.setSpacing(2)
+        label_l.addWidget(QLabel(label))
+        help_btn = QPushButton("?")
+        help_btn.setObjectName("score_help_btn")
+        help_btn.setFixedSize(20, 20)
+        help_btn.clicked.connect(partial(self._show_score_help, score_key))
+        label_l.addWidget(help_btn)
+        label_l.addStretch()
+        grid.addWidget(label_w, row, 0)
+
+        buttons = {}
+        btn_group = QButtonGroup(self)
+        btn_group.setExclusive(False)
+        btn_group.buttonClicked.connect(
+            partial(self._on_exclusive_score_click, btn_group, score_key)
+        )
+        for i in range(6):
+            btn = QPushButton(str(i))
+            btn.setCheckable(True)
+            btn.setFixedSize(self.SCORE_BUTTON_SIZE, self.SCORE_BUTTON_SIZE)
+            btn.setObjectName(object_name)
+            btn_group.addButton(btn, i)
+            grid.addWidget(btn, row, i + 1)
+            buttons[i] = btn
+        return btn_group, buttons
 
     def create_menu_bar(self):
         menubar = self.menuBar()
@@ -426,7 +491,7 @@ class PoseEditor(QMainWindow):
 
         save_action = QAction("保存", self)
         save_action.setShortcut("Ctrl+S")
-        save_action.triggered.connect(self.save_current)
+        save_action.triggered.connect(self.save_now)
         file_menu.addAction(save_action)
 
         edit_menu = menubar.addMenu("编辑")
@@ -441,31 +506,44 @@ class PoseEditor(QMainWindow):
         edit_menu.addAction(redo_action)
 
     def update_keypoint_list(self):
-        self.keypoint_list.clear()
-        for kp in self.canvas.pose_data.keypoints:
-            if kp.visibility == 1:
-                prefix = "● "
-            else:
-                prefix = "✕ "
-            item = QListWidgetItem(prefix + kp.name)
-            self.keypoint_list.addItem(item)
-
-    def on_keypoint_selected(self, name: str):
+        # 模型直接引用关键点列表，刷新只需通知视图重新取数。
+        self.keypoint_model.set_keypoints(self.canvas.pose_data.keypoints)
+
+    def refresh_keypoint_row(self, index: int):
+        self.keypoint_model.refresh_row(index)
+        # 选中点的可见性可能变化，状态栏随之刷新。
+        self._schedule_refresh(keypoint_list=False)
+
+    def _schedule_refresh(self, keypoint_list: bool = True):
+        """合并同一轮事件循环内的多次刷新请求，稍后只刷新一次状态栏（及关键点列表）。"""
+        self._refresh_list_pending |= keypoint_list
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            QTimer.singleShot(0, self._do_refresh)
+
+    def _do_refresh(self):
+        self._refresh_pending = False
+        if self._refresh_list_pending:
+            self._refresh_list_pending = False
+            self.update_keypoint_list()
         self.update_status()
-        for i in range(self.keypoint_list.count()):
-            item_text = self.keypoint_list.item(i).text()
-            if item_text[2:] == name:
-                self.keypoint_list.setCurrentRow(i)
-                break
-
-    def on_list_item_clicked(self, item: QListWidgetItem):
-        kp_name = item.text()[2:]
-        for kp in self.canvas.pose_data.keypoints:
-            if kp.name == kp_name:
-                self.canvas.selected_keypoint = kp
-                self.canvas.update()
-                self.update_status()
-                break
+
+    def on_keypoint_selected(self, _name: str, index: int):
+        self.keypoint_list.setCurrentIndex(self.keypoint_model.index(index))
+        self._schedule_refresh(keypoint_list=False)
+
+    def on_list_item_clicked(self, index: QModelIndex):
+        self.canvas.selected_index = index.data(Qt.UserRole)
+        self.canvas.update()
+        self._schedule_refresh(keypoint_list=False)
+
+    _IGNORE_TOOLTIPS = {
+        "美感不足": "1 | 美感不足。如果图像不是具有美感的人物照片（例如日常照片），则可点击该按钮跳过。",
+        "难以补全": "2 | 难以补全。如果图像中的人物下半身都在画面外，难以拖拽画面外的遮挡点到猜测位置，则点它跳过。",
+        "背景失真": "3 | 背景失真。这里的图像是将人物图像中的人物区域给删除修复得到的无人场景图。如果该图像有异常纹理等不真实的情况，则点它跳过。",
+        "比例失调": "4 | 比例失调。如果人物占画面的比例非常小或大，无法确定姿态，则点它跳过。",
+        "图像模糊": "5 | 图像模糊。如果图像分辨率很低，或图像质量不佳，则可点它跳过。",
+    }
 
     _SCORE_HELP_TEXT = {
         "novelty": (
@@ -545,17 +623,102 @@ class PoseEditor(QMainWindow):
             setattr(self.canvas.pose_data, score_type, clicked_id)
         else:
             setattr(self.canvas.pose_data, score_type, -1)
+        self.canvas.dirty = True
+
+    def _scan_annotation_files(self):
+        """扫描标注目录，记录已存在的标注文件。
+
+        原图目录可能很大，不在这里遍历；旧结构下与图片同目录的标注文件
+        由 _annotation_exists 在首次查询时检查。
+        """
+        self._annotation_files = set()
+        self._annotation_dir = None
+        self._sidecar_exists = {}
+        self._annotation_path_cache = {}
+        self._needs_processing = {}
+        directory = self.json_dir
+        if directory is None or not directory.is_dir():
+            return
+        self._annotation_dir = str(directory)
+        with os.scandir(directory) as entries:
+            self._annotation_files.update(
+                str(directory / entry.name)
+                for entry in entries
+                if entry.name.lower().endswith(".json") and entry.is_file()
+            )
+
+    def _annotation_exists(self, json_path: Union[str, Path]) -> bool:
+        if self._annotation_files is None:
+            return os.path.exists(json_path)
+        key = str(json_path)
+        if key in self._annotation_files:
+            return True
+        if os.path.dirname(key) == self._annotation_dir:
+            return False
+        exists = self._sidecar_exists.get(key)
+        if exists is None:
+            exists = os.path.exists(key)
+            self._sidecar_exists[key] = exists
+        return exists
+
+    def _mark_annotation_written(self, json_path: Union[str, Path]):
+        if self._annotation_files is not None:
+            self._annotation_files.add(str(json_path))
+
+    def _write_annotation(self, image_path: Path, json_path: Union[str, Path], data):
+        """在界面线程序列化快照，交给后台线程写入。"""
+        self.annotation_writer.write(str(json_path), dumps(data))
+        self._annotation_cache.pop(str(json_path), None)
+        self._writing_annotations[str(json_path)] = str(image_path)
+        self._mark_annotation_written(json_path)
+        self.prefetcher.discard_annotation(str(image_path))
+
+    def _read_annotation(self, json_path: Path):
+        """读取并解析标注文件；修改时间与大小未变时返回缓存的解析结果。"""
+        key = str(json_path)
+        st = os.stat(key)
+        entry = self._annotation_cache.get(key)
+        if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            self._annotation_cache.move_to_end(key)
+            return entry[2]
+        data = read_json(key)
+        self._annotation_cache[key] = (st.st_mtime_ns, st.st_size, data)
+        self._annotation_cache.move_to_end(key)
+        while len(self._annotation_cache) > self.ANNOTATION_CACHE_SIZE:
+            self._annotation_cache.popitem(last=False)
+        return data
+
+    def _on_annotation_written(self, json_path: str):
+        # 后台预读可能在写入完成前读到旧内容，写完后再丢弃一次。
+        image_path = self._writing_annotations.get(json_path)
+        if image_path is None:
+            return
+        if self.annotation_writer.pending(json_path) is None:
+            del self._writing_annotations[json_path]
+        self.prefetcher.discard_annotation(image_path)
+
+    def _on_annotation_write_failed(self, json_path: str, error: str):
+        QMessageBox.warning(self, "错误", f"保存失败: {Path(json_path).name}: {error}")
 
     def _get_annotation_path(self, image_path: Path) -> Path:
         """解析标注路径，并兼容旧目录结构。"""
+        # 解析结果在写入后依然成立（写入的正是解析出的路径），可按图片缓存。
+        key = str(image_path)
+        cached = self._annotation_path_cache.get(key)
+        if cached is not None:
+            return cached
         if self.json_dir and self.origin_dir and self.json_dir != self.origin_dir:
             json_path = self.json_dir / f"{image_path.stem}.json"
             old_json_path = image_path.with_suffix(".json")
             # 新路径不存在时，回退读取旧结构中与图片同目录的标注文件。
-            if not json_path.exists() and old_json_path.exists():
-                return old_json_path
-            return json_path
-        return image_path.with_suffix(".json")
+            if not self._annotation_exists(json_path) and self._annotation_exists(
+                old_json_path
+            ):
+                json_path = old_json_path
+        else:
+            json_path = image_path.with_suffix(".json")
+        self._annotation_path_cache[key] = json_path
+        return json_path
 
     def _collect_json_candidates(self, image_path: Path) -> list[Path]:
         """收集可能存在的标注文件路径，并按路径去重。"""
@@ -569,8 +732,8 @@ class PoseEditor(QMainWindow):
         deduped: list[Path] = []
         seen = set()
         for path in candidates:
-            # 已存在文件用真实路径去重；不存在文件用字符串路径去重。
-            key = str(path.resolve()) if path.exists() else str(path)
+            # 候选路径都由同一项目目录拼出，规范化字符串即可去重，无需逐个 stat。
+            key = os.path.normcase(os.path.normpath(path))
             if key not in seen:
                 deduped.append(path)
                 seen.add(key)
@@ -580,9 +743,10 @@ class PoseEditor(QMainWindow):
         """当图片列表为空时统一重置界面状态，避免分支重复。"""
         self.canvas.image = None
         self.canvas.pose_data = PoseData()
-        self.canvas.selected_keypoint = None
+        self.canvas.selected_index = None
         self.canvas.update()
         self.current_image_path = None
+        self._current_path = None
         self.current_annotation_path = None
         self._update_inpainting_preview()
         self.update_keypoint_list()
@@ -609,10 +773,7 @@ class PoseEditor(QMainWindow):
         # 如果图片子目录不存在，检查根目录是否直接有图片（兼容旧结构）
         if not origin.exists():
             # 看看根目录自身有没有图片
-            has_images_at_root = any(
-                f.is_file() and f.suffix.lower() in IMAGE_EXTENSIONS
-                for f in root.iterdir()
-            )
+            has_images_at_root = any(True for _ in _iter_image_entries(root))
             if has_images_at_root:
                 # 旧结构：用户选的根目录本身就是图片目录
                 # 提示用户是否自动迁移
@@ -628,7 +789,9 @@ class PoseEditor(QMainWindow):
                     QMessageBox.No,
                 )
                 if reply == QMessageBox.Yes:
+                    # 迁移成功后由其自行加载项目；失败时已提示用户，不再继续打开。
                     self._migrate_to_project_structure(root)
+                    return
                 else:
                     # 旧模式兼容：不使用子目录
                     self.project_root = root
@@ -670,14 +833,45 @@ class PoseEditor(QMainWindow):
         json_dir.mkdir(parents=True, exist_ok=True)
         inpaint.mkdir(parents=True, exist_ok=True)
 
-        moved_count = 0
-        for f in root.iterdir():
-            if f.is_file():
-                if f.suffix.lower() in IMAGE_EXTENSIONS:
-                    shutil.move(str(f), str(origin / f.name))
+        with os.scandir(root) as entries:
+            # 先收集再移动，避免边遍历边修改目录。
+            moves = []
+            moved_count = 0
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                suffix = _ext_of(entry.name)
+                if suffix in IMAGE_EXTENSIONS:
+                    moves.append((entry.path, origin / entry.name))
                     moved_count += 1
-                elif f.suffix.lower() == ".json" and f.name != META_FILE:
-                    shutil.move(str(f), str(json_dir / f.name))
+                elif suffix == ".json" and entry.name not in (META_FILE, INDEX_FILE):
+                    moves.append((entry.path, json_dir / entry.name))
+
+        # 子目录与源文件同在 root 下，通常只是重命名；文件很多时显示进度。
+        progress = QProgressDialog("正在迁移文件…", None, 0, len(moves), self)
+        progress.setWindowTitle("迁移项目结构")
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(500)
+        done = 0
+        try:
+            for i, (src, dst) in enumerate(moves):
+                _move_file(Path(src), dst)
+                done += 1
+                if i % 100 == 0:
+                    progress.setValue(i)
+            progress.setValue(len(moves))
+        except OSError as e:
+            QMessageBox.warning(
+                self,
+                "迁移未完成",
+                f"迁移 {os.path.basename(src)} 时出错: {e}\n\n"
+                f"已移动 {done}/{len(moves)} 个文件，其余文件仍留在 {root}。\n"
+                f"请处理问题后重新打开该文件夹。",
+            )
+            return
+        finally:
+            progress.close()
+            progress.deleteLater()
 
         self.project_root = root
         self.origin_dir = origin
@@ -691,15 +885,21 @@ class PoseEditor(QMainWindow):
 
     def _load_project(self):
         """加载项目：扫描图片、更新 meta.json 并刷新界面。"""
-        # 更新 meta.json
-        self._update_meta()
+        self._build_secondary_panel()
+        # 先把上一个项目尚未写盘的 meta 落盘，再读取新项目的 meta
+        self._flush_meta()
+        self._meta_path = self.project_root / META_FILE
+        self._meta = self._read_meta()
 
         # 读取上次处理到的图片
-        meta = self._read_meta()
-        last_image = meta.get("last_image", "")
+        last_image = self._meta.get("last_image", "")
 
-        # 扫描图片
-        self.load_images_from_folder(str(self.origin_dir), autoload=False)
+        # 扫描图片与已有标注（先等待上一个项目的写入完成）
+        self.annotation_writer.flush()
+        self._scan_annotation_files()
+        self._inpaint_index = None
+        self._inpaint_cache.clear()
+        self._annotation_cache.clear()
 
         # 更新项目路径显示
         if self.project_root:
@@ -708,6 +908,112 @@ class PoseEditor(QMainWindow):
                 f"姿态标注修正工具 v{APP_VERSION} — {self.project_root.name}"
             )
 
+        self._cancel_image_scan()
+        self._image_scan_generation += 1
+        folder = self.origin_dir
+
+        # 原图目录自上次扫描后没有增删文件时，直接使用索引中的文件列表
+        folder_mtime_ns = os.stat(folder).st_mtime_ns
+        image_files = self._read_image_index(folder_mtime_ns)
+        if image_files is not None:
+            self._finish_project_load(image_files, last_image)
+            return
+
+        # 扫描原图目录；图片较少时在本次调用内完成，否则分批进行
+        self._image_scan_entries = (
+            folder / entry.name for entry in _iter_image_entries(folder)
+        )
+        self._image_scan_found = []
+        self._continue_image_scan(
+            self._image_scan_generation, last_image, folder_mtime_ns
+        )
+
+    def _image_index_path(self) -> Optional[Path]:
+        # 旧结构下原图目录就是项目根目录，写入索引或 meta 都会改变目录修改时间，不使用索引。
+        if not self.project_root or self.origin_dir == self.project_root:
+            return None
+        return self.project_root / INDEX_FILE
+
+    def _read_image_index(self, folder_mtime_ns: int) -> Optional[list[Path]]:
+        """读取原图目录索引；索引缺失、损坏或目录已变化时返回 None。"""
+        index_path = self._image_index_path()
+        if index_path is None:
+            return None
+        try:
+            index = read_json(index_path)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(index, dict) or index.get("mtime_ns") != folder_mtime_ns:
+            return None
+        names = index.get("names")
+        if not isinstance(names, list):
+            return None
+        return [self.origin_dir / name for name in names]
+
+    def _write_image_index(self, folder_mtime_ns: int, image_files: list[Path]):
+        """记录扫描时原图目录的修改时间与排好序的文件名。"""
+        index_path = self._image_index_path()
+        if index_path is None:
+            return
+        # 修改时间距今太近时不写：时间戳粒度较粗的文件系统上，
+        # 同一时间戳内的后续增删无法与本次扫描区分。
+        if time.time_ns() - folder_mtime_ns < self.INDEX_MIN_AGE_NS:
+            return
+        try:
+            write_json(
+                index_path,
+                {"mtime_ns": folder_mtime_ns, "names": [p.name for p in image_files]},
+            )
+        except OSError as e:
+            print(f"Warning: failed to write {INDEX_FILE}: {e}")
+
+    def _continue_image_scan(
+        self, generation: int, last_image: str, folder_mtime_ns: int
+    ):
+        """扫描下一批图片；目录未读完时排队下一批，读完后完成项目加载。"""
+        if generation != self._image_scan_generation:
+            return
+        batch = list(islice(self._image_scan_entries, self.IMAGE_SCAN_BATCH))
+        self._image_scan_found.extend(batch)
+        if len(batch) == self.IMAGE_SCAN_BATCH:
+            if len(self._image_scan_found) == self.IMAGE_SCAN_BATCH:
+                # 首次让出事件循环前清空界面，避免在扫描期间操作上一个项目的图片。
+                self.image_files = []
+                self._reset_after_image_list_empty()
+            self.status_bar.showMessage(
+                f"正在扫描图片… 已找到 {len(self._image_scan_found)} 张"
+            )
+            QTimer.singleShot(
+                0,
+                partial(
+                    self._continue_image_scan, generation, last_image, folder_mtime_ns
+                ),
+            )
+            return
+
+        self._image_scan_entries = None
+        image_files, self._image_scan_found = self._image_scan_found, []
+        image_files.sort()
+        self._write_image_index(folder_mtime_ns, image_files)
+        self._finish_project_load(image_files, last_image)
+
+    def _cancel_image_scan(self):
+        if self._image_scan_entries is not None:
+            # 关闭生成器会一并关闭其中的 scandir 迭代器。
+            self._image_scan_entries.close()
+            self._image_scan_entries = None
+        self._image_scan_found = []
+
+    def _finish_project_load(self, image_files: list[Path], last_image: str):
+        """图片列表就绪后启动状态扫描、更新 meta 并恢复上次的位置。"""
+        self.image_files = image_files
+        if not self.image_files:
+            QMessageBox.information(self, "提示", f"{self.origin_dir} 下没有图片")
+        self._start_status_scan()
+
+        # 更新 meta.json，图片数量直接取刚扫描的结果
+        self._update_meta(len(self.image_files))
+
         if not self.image_files:
             return
 
@@ -720,12 +1026,15 @@ class PoseEditor(QMainWindow):
                     break
         self.load_current_image()
 
-    def _update_meta(self):
-        """更新 meta.json（记录打开时间等协作信息）。"""
+    def _update_meta(self, image_count: Optional[int] = None):
+        """更新 meta.json（记录打开时间等协作信息）。
+
+        image_count 为已知的图片数量，省略时重新扫描原图目录统计。
+        """
         if not self.project_root:
             return
 
-        meta = self._read_meta()
+        meta = self._meta
 
         username = getpass.getuser()
         now = datetime.now().isoformat(timespec="seconds")
@@ -734,21 +1043,18 @@ class PoseEditor(QMainWindow):
         meta["last_opened_by"] = username
 
         # 维护打开历史
-        history = meta.get("open_history", [])
+        history = meta.setdefault("open_history", [])
         history.append({"time": now, "user": username})
-        # 只保留最近50条
-        meta["open_history"] = history[-50:]
+        # 原地裁剪，只保留最近若干条
+        del history[: -self.OPEN_HISTORY_LIMIT]
 
         # 统计图片数量
-        if self.origin_dir and self.origin_dir.exists():
-            count = sum(
-                1
-                for f in self.origin_dir.iterdir()
-                if f.is_file() and f.suffix.lower() in IMAGE_EXTENSIONS
-            )
-            meta["total_images"] = count
+        if image_count is not None:
+            meta["total_images"] = image_count
+        elif self.origin_dir and self.origin_dir.exists():
+            meta["total_images"] = sum(1 for _ in _iter_image_entries(self.origin_dir))
 
-        self._write_meta(meta)
+        self._schedule_meta_flush()
 
     def _read_meta(self) -> dict:
         """读取 meta.json。"""
@@ -757,20 +1063,24 @@ class PoseEditor(QMainWindow):
         meta_path = self.project_root / META_FILE
         if meta_path.exists():
             try:
-                with open(meta_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
+                return read_json(meta_path)
             except Exception:
                 return {}
         return {}
 
-    def _write_meta(self, meta: dict):
-        """写入 meta.json。"""
-        if not self.project_root:
+    def _schedule_meta_flush(self):
+        """标记 meta 已修改，并（重新）启动延迟写盘定时器。"""
+        self._meta_dirty = True
+        self._meta_flush_timer.start()
+
+    def _flush_meta(self):
+        """把内存中的 meta 原子写入 meta.json。"""
+        self._meta_flush_timer.stop()
+        if not self._meta_dirty or self._meta_path is None:
             return
-        meta_path = self.project_root / META_FILE
+        self._meta_dirty = False
         try:
-            with open(meta_path, "w", encoding="utf-8") as f:
-                json.dump(meta, f, indent=2, ensure_ascii=False)
+            write_json(self._meta_path, self._meta)
         except Exception as e:
             print(f"Warning: failed to write meta.json: {e}")
 
@@ -778,23 +1088,45 @@ class PoseEditor(QMainWindow):
         """将当前处理的图片文件名记录到 meta.json。"""
         if not self.project_root or not self.current_image_path:
             return
-        meta = self._read_meta()
-        meta["last_image"] = Path(self.current_image_path).name
-        self._write_meta(meta)
+        self._meta["last_image"] = self._current_path.name
+        self._schedule_meta_flush()
 
     def _find_inpainting_image(self, image_name_stem: str) -> Optional[Path]:
         """在 inpainting 目录中查找同名参考图（允许不同后缀）。"""
-        if not self.inpaint_dir or not self.inpaint_dir.exists():
-            return None
-
-        for candidate in self.inpaint_dir.iterdir():
-            if (
-                candidate.is_file()
-                and candidate.stem == image_name_stem
-                and candidate.suffix.lower() in INPAINT_EXTENSIONS
-            ):
-                return candidate
-        return None
+        if self._inpaint_index is None:
+            self._inpaint_index = {}
+            if self.inpaint_dir and self.inpaint_dir.is_dir():
+                for entry in _iter_image_entries(self.inpaint_dir, INPAINT_EXTENSIONS):
+                    name = entry.name
+                    # 与其他文件名处理一致，用 _ext_of 切分扩展名。
+                    stem = name[: len(name) - len(_ext_of(name))]
+                    # 同名多后缀时沿用目录遍历中最先出现的一个。
+                    self._inpaint_index.setdefault(stem, self.inpaint_dir / name)
+        return self._inpaint_index.get(image_name_stem)
+
+    def _inpainting_preview_size(self) -> tuple[int, int]:
+        return self.inpaint_label.width() - 4, self.inpaint_label.maximumHeight() - 4
+
+    def _inpainting_pixmap(self, stem: str, inpaint_path: Path) -> QPixmap:
+        """返回缩放到预览区域的参考图，优先取缓存；加载失败时返回空 QPixmap。"""
+        width, height = self._inpainting_preview_size()
+        key = (stem, width, height)
+        pixmap = self._inpaint_cache.get(key)
+        if pixmap is not None:
+            self._inpaint_cache.move_to_end(key)
+            return pixmap
+
+        # 后台已预读到预览尺寸时直接转换，否则同步解码。
+        image = self.prefetcher.take_preview((str(inpaint_path), width, height))
+        if image is None:
+            image = decode_image_to_fit(str(inpaint_path), width, height)
+        pixmap = QPixmap.fromImage(image)
+        if pixmap.isNull():
+            return pixmap
+        self._inpaint_cache[key] = pixmap
+        while len(self._inpaint_cache) > self.INPAINT_CACHE_SIZE:
+            self._inpaint_cache.popitem(last=False)
+        return pixmap
 
     def _update_inpainting_preview(self):
         """更新右下角的 inpainting 参考图预览。"""
@@ -804,20 +1136,13 @@ class PoseEditor(QMainWindow):
             self.inpaint_filename_label.setText("")
             return
 
-        stem = Path(self.current_image_path).stem
+        stem = self._current_path.stem
         inpaint_path = self._find_inpainting_image(stem)
 
         if inpaint_path:
-            pixmap = QPixmap(str(inpaint_path))
+            pixmap = self._inpainting_pixmap(stem, inpaint_path)
             if not pixmap.isNull():
-                # 缩放以适应预览区域
-                scaled = pixmap.scaled(
-                    self.inpaint_label.width() - 4,
-                    self.inpaint_label.maximumHeight() - 4,
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation,
-                )
-                self.inpaint_label.setPixmap(scaled)
+                self.inpaint_label.setPixmap(pixmap)
                 self.inpaint_filename_label.setText(f"📎 {inpaint_path.name}")
             else:
                 self.inpaint_label.setPixmap(QPixmap())
@@ -836,7 +1161,7 @@ class PoseEditor(QMainWindow):
         """将当前损坏图片移入 Ignore/图片损坏，在JSON中标记损坏原因并加载下一张。"""
         if not self.current_image_path:
             return
-        image_path = Path(self.current_image_path)
+        image_path = self._current_path
 
         # 确定 Ignore 目标路径
         base_dir = self.project_root if self.project_root else image_path.parent
@@ -851,11 +1176,11 @@ class PoseEditor(QMainWindow):
             # 保存标注（确保损坏原因落盘）- 保留在原位置
             data = [self.canvas.pose_data.to_dict()]
             json_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(json_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            self._write_annotation(image_path, json_path, data)
 
             # 只移动图片，不移动JSON标注文件
-            shutil.move(str(image_path), str(ignore_dir / image_path.name))
+            _move_file(image_path, ignore_dir / image_path.name)
+            self.prefetcher.discard(str(image_path))
 
             print(f"Moved corrupt image {image_path.name} to ignore/图片损坏/ (JSON kept at original location with damage reason)")
 
@@ -881,7 +1206,7 @@ class PoseEditor(QMainWindow):
         if not self.current_image_path:
             return
 
-        image_path = Path(self.current_image_path)
+        image_path = self._current_path
 
         # 标注路径：优先使用当前加载路径，避免写到错误位置
         json_path = self._get_annotation_path(image_path)
@@ -901,11 +1226,11 @@ class PoseEditor(QMainWindow):
             data = [self.canvas.pose_data.to_dict()]
             # 确保标注目录存在
             json_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(json_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            self._write_annotation(image_path, json_path, data)
 
             # 只移动图片，不移动JSON标注文件
-            shutil.move(str(image_path), str(ignore_dir / image_path.name))
+            _move_file(image_path, ignore_dir / image_path.name)
+            self.prefetcher.discard(str(image_path))
 
             print(f"Moved {image_path.name} to ignore/{folder_name}/ (JSON kept at original location)")
 
@@ -985,7 +1310,7 @@ class PoseEditor(QMainWindow):
 
     def update_status(self):
         if self.current_image_path:
-            filename = Path(self.current_image_path).name
+            filename = self._current_path.name
             status = (
                 f"图片: {filename} ({self.current_index + 1}/{len(self.image_files)})"
             )
@@ -995,44 +1320,33 @@ class PoseEditor(QMainWindow):
         if self.canvas.pose_data.skip_reason:
             status += f" | [已跳过: {self.canvas.pose_data.skip_reason}]"
 
-        if self.canvas.selected_keypoint:
-            kp = self.canvas.selected_keypoint
-            vis_map = {0: "遮挡", 1: "可见"}
-            status += f" | 选中: {kp.name} ({vis_map[kp.visibility]})"
-
-        self.status_bar.showMessage(status)
-
-    def load_images_from_folder(self, folder: str, autoload: bool = True):
-        folder_path = Path(folder)
-        self.image_files = [
-            path
-            for path in folder_path.iterdir()
-            if path.is_file() and path.suffix.lower() in IMAGE_EXTENSIONS
-        ]
-
-        self.image_files.sort()
-        if self.image_files:
-            self.current_index = 0
-            if autoload:
-                self.load_current_image()
-        else:
-            QMessageBox.information(self, "提示", f"{folder_path} 下没有图片")
+        kp = self.canvas.selected_keypoint
+        if kp:
+            status += f" | 选中: {kp.name} ({_VIS_LABELS[kp.visibility == 1]})"
+
+        # 内容未变时不再通知状态栏，省去一次重绘。
+        if status != self.status_bar.currentMessage():
+            self.status_bar.showMessage(status)
 
     def load_current_image(self):
         if not self.image_files:
             return
-        self.current_image_path = str(self.image_files[self.current_index])
+        self._current_path = self.image_files[self.current_index]
+        self.current_image_path = str(self._current_path)
 
-        image = QImage(self.current_image_path)
+        image = self.prefetcher.get(self.current_image_path)
+        if image is None:
+            image = decode_image(self.current_image_path)
         if image.isNull():
             # 加载失败：自动移入 Ignore/图片损坏
-            failed_name = Path(self.current_image_path).name
+            failed_name = self._current_path.name
             self._move_corrupt_to_ignore()
             self.status_bar.showMessage(f"⚠ 图片损坏已移除: {failed_name}", 3000)
             # 内部会调整索引并递归加载下一张
             return
 
         self.canvas.set_image(image)
+        self.prefetcher.put(self.current_image_path, image)
         self.load_annotation()
 
         # 开始计时
@@ -1046,25 +1360,50 @@ class PoseEditor(QMainWindow):
         # 更新 inpainting 预览
         self._update_inpainting_preview()
 
+        # 趁用户处理当前图片时，后台解码前后两张。
+        self._prefetch_neighbors()
+
+    def _prefetch_neighbors(self):
+        items = []
+        previews = []
+        width, height = self._inpainting_preview_size()
+        for i in (self.current_index + 1, self.current_index - 1):
+            if 0 <= i < len(self.image_files):
+                image_path = self.image_files[i]
+                json_path = self._get_annotation_path(image_path)
+                # 已知不存在的标注无需交给后台读取。
+                annotation = (
+                    str(json_path) if self._annotation_exists(json_path) else None
+                )
+                items.append((str(image_path), annotation))
+                # 参考图预览已在缓存中时不再预读。
+                stem = image_path.stem
+                inpaint_path = self._find_inpainting_image(stem)
+                if inpaint_path and (stem, width, height) not in self._inpaint_cache:
+                    previews.append((str(inpaint_path), width, height))
+        self.prefetcher.prefetch(items)
+        self.prefetcher.prefetch_previews(previews)
+
     def load_annotation(self):
         if not self.current_image_path:
             return
 
-        image_path = Path(self.current_image_path)
+        image_path = self._current_path
 
         json_path = self._get_annotation_path(image_path)
 
         pose_data = PoseData()
 
-        if json_path.exists():
+        # 优先使用尚未写完的内容，其次是后台预读的标注，都未命中时再同步读取。
+        found, data = self.prefetcher.take_annotation(self.current_image_path)
+        pending = self.annotation_writer.pending(str(json_path))
+        if pending is not None:
+            found, data = True, loads(pending)
+        if found or self._annotation_exists(json_path):
             try:
-                with open(json_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    if isinstance(data, list):
-                        if len(data) > 0:
-                            pose_data = PoseData.from_dict(data[0])
-                    else:
-                        pose_data = PoseData.from_dict(data)
+                if not found:
+                    data = self._read_annotation(json_path)
+                pose_data = _pose_from_annotation(data)
             except Exception as e:
                 print(f"Error loading JSON: {e}")
 
@@ -1076,14 +1415,11 @@ class PoseEditor(QMainWindow):
         self.update_skip_buttons()
 
         if self.canvas.pose_data.keypoints:
-            first_kp = self.canvas.pose_data.keypoints[0]
-            self.canvas.selected_keypoint = first_kp
-            self.on_keypoint_selected(first_kp.name)
+            self.canvas.selected_index = 0
+            self.on_keypoint_selected(self.canvas.pose_data.keypoints[0].name, 0)
 
-        if pose_data.has_valid_keypoints():
-            self.canvas.focus_on_pose()
-        else:
-            self.canvas.fit_to_window()
+        # 没有有效关键点时 focus_on_pose 自行回退为适应窗口。
+        self.canvas.focus_on_pose()
 
     def _set_score_group_value(
         self,
@@ -1113,30 +1449,61 @@ class PoseEditor(QMainWindow):
             pose_data.person_fit,
         )
 
-    def _accumulate_time(self):
-        """将本次浏览耗时累加到当前 pose_data 上。"""
-        if self._image_start_time is not None:
-            elapsed = time.monotonic() - self._image_start_time
-            self.canvas.pose_data.time_spent += elapsed
-            self._image_start_time = time.monotonic()
+    def _elapsed_time(self) -> float:
+        """当前图片自开始计时（或上次累加）以来的秒数。"""
+        if self._image_start_time is None:
+            return 0.0
+        return time.monotonic() - self._image_start_time
 
-    def save_current(self):
+    def _accumulate_time(self, elapsed: float):
+        """将耗时累加到当前 pose_data 上，并重新开始计时。"""
+        if self._image_start_time is None:
+            return
+        self.canvas.pose_data.time_spent += elapsed
+        self._image_start_time = time.monotonic()
+
+    # 未做修改且停留不足该秒数的快速浏览不重写标注文件，这段耗时也不计入 time_spent。
+    SKIM_SECONDS = 2.0
+
+    def save_now(self):
+        """手动保存（按钮与 Ctrl+S），无论是否修改都写入。"""
+        self.save_current(force=True)
+
+    def save_current(self, force: bool = False):
         if not self.current_annotation_path:
             return
-        self._accumulate_time()
+        elapsed = self._elapsed_time()
+        # 每次翻页都会保存，直接使用路径字符串，不再构造 Path 对象。
+        ann_path = self.current_annotation_path
+        if (
+            not force
+            and not self.canvas.dirty
+            and elapsed < self.SKIM_SECONDS
+            and self._annotation_exists(ann_path)
+        ):
+            # 文件内容与内存一致，只更新处理位置。耗时不累加，避免内存中的
+            # time_spent 与文件不一致；计时也不重置，同一次停留之后再保存时仍会计入。
+            self._save_last_image_to_meta()
+            return
+        self._accumulate_time(elapsed)
         try:
             # 确保目录存在
-            ann_path = Path(self.current_annotation_path)
-            ann_path.parent.mkdir(parents=True, exist_ok=True)
+            os.makedirs(os.path.dirname(ann_path), exist_ok=True)
 
-            data = [self.canvas.pose_data.to_dict()]
-            with open(self.current_annotation_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            self._write_annotation(
+                self._current_path, ann_path, [self.canvas.pose_data.to_dict()]
+            )
+            self.canvas.dirty = False
+            self._needs_processing[self.current_image_path] = (
+                self.should_process_image()
+            )
 
             # 记录当前处理位置
             self._save_last_image_to_meta()
 
-            self.status_bar.showMessage(f"已保存: {ann_path.name}", 2000)
+            self.status_bar.showMessage(
+                f"已保存: {os.path.basename(ann_path)}", 2000
+            )
         except Exception as e:
             QMessageBox.warning(self, "错误", f"保存失败: {e}")
 
@@ -1152,8 +1519,9 @@ class PoseEditor(QMainWindow):
             QMessageBox.warning(self, "提示", "标注文件夹中没有JSON文件，无法导出。")
             return
 
-        # 先保存当前标注
+        # 先保存当前标注，并等待后台写入全部落盘
         self.save_current()
+        self.annotation_writer.flush()
 
         # 输入导出名称
         default_name = Path(self.project_root).name
@@ -1206,23 +1574,88 @@ class PoseEditor(QMainWindow):
             return
         if not self.validate_before_navigate():
             return
-        original_index = self.current_index
         self.save_current()
-        while self.current_index < len(self.image_files) - 1:
-            self.current_index += 1
-            self.load_current_image()
-            if self.should_process_image():
+        # 只读取标注判断状态，找到目标后才解码图片。
+        for i in range(self.current_index + 1, len(self.image_files)):
+            if self._image_needs_processing(self.image_files[i]):
+                self.current_index = i
+                self.load_current_image()
                 return
-        self.current_index = original_index
-        self.load_current_image()
         QMessageBox.information(self, "提示", "没有更多需要处理的图片")
 
+    def _image_needs_processing(self, image_path: Path) -> bool:
+        """根据标注文件判断图片是否还需要处理，结果按路径缓存。"""
+        key = str(image_path)
+        needs = self._needs_processing.get(key)
+        if needs is None:
+            pose = PoseData()
+            json_path = self._get_annotation_path(image_path)
+            if self._annotation_exists(json_path):
+                try:
+                    pose = _pose_from_annotation(read_json(json_path))
+                except Exception as e:
+                    print(f"Error loading JSON: {e}")
+            needs = pose.needs_processing()
+            self._needs_processing[key] = needs
+        return needs
+
+    def _start_status_scan(self):
+        """在后台读取全部已有标注，预先填充图片的处理状态。"""
+        self._cancel_status_scan()
+        self._status_scan_generation += 1
+        if not self.image_files:
+            return
+        # 只在主线程拼出候选标注路径（与 _get_annotation_path 的查找顺序一致），
+        # 文件是否存在交给后台检查，打开大项目时界面线程不逐个 stat。
+        json_dir = None
+        if self.json_dir and self.origin_dir and self.json_dir != self.origin_dir:
+            json_dir = str(self.json_dir)
+        items = []
+        for image_path in self.image_files:
+            path = str(image_path)
+            base = os.path.splitext(path)[0]
+            legacy = base + ".json"
+            if json_dir is None:
+                candidates = (legacy,)
+            else:
+                name = os.path.basename(base) + ".json"
+                candidates = (os.path.join(json_dir, name), legacy)
+            items.append((path, candidates))
+        self._status_scanner = AnnotationScanner(
+            self._status_scan_generation,
+            items,
+            _annotation_needs_processing,
+            self._scan_signals,
+        )
+        QThreadPool.globalInstance().start(self._status_scanner)
+
+    def _cancel_status_scan(self):
+        if self._status_scanner is not None:
+            self._status_scanner.cancel()
+            self._status_scanner = None
+
+    def _on_status_scan_finished(self, generation: int, results: dict):
+        if generation != self._status_scan_generation:
+            return
+        self._status_scanner = None
+        # 扫描期间保存过的图片已有更新的状态，不被扫描结果覆盖。
+        # 后台已查明的标注文件存在性一并记下，之后翻页解析标注路径时无需再 stat。
+        for path, (json_path, needs) in results.items():
+            if json_path is None:
+                # 没有标注文件的图片一定需要处理。
+                needs = True
+                sidecar = os.path.splitext(path)[0] + ".json"
+                self._sidecar_exists.setdefault(sidecar, False)
+            elif os.path.dirname(json_path) == self._annotation_dir:
+                if self._annotation_files is not None:
+                    self._annotation_files.add(json_path)
+            else:
+                self._sidecar_exists[json_path] = True
+            self._needs_processing.setdefault(path, needs)
+
     def should_process_image(self) -> bool:
         """判断当前图片是否还需要处理（评分不完整）"""
-        pose = self.canvas.pose_data
-        if pose.skip_reason:
-            return False  # 已标记跳过
-        return not self.has_complete_scores()
+        return self.canvas.pose_data.needs_processing()
 
     def fit_to_window(self):
         self.canvas.fit_to_window()
@@ -1238,72 +1671,62 @@ class PoseEditor(QMainWindow):
         self.canvas.update()
 
     def undo(self):
-        if self.canvas.undo_stack.undo():
-            self.canvas.update()
-            self.update_keypoint_list()
+        if self.canvas.undo():
+            self._schedule_refresh()
 
     def redo(self):
-        if self.canvas.undo_stack.redo():
-            self.canvas.update()
-            self.update_keypoint_list()
+        if self.canvas.redo():
+            self._schedule_refresh()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._secondary_panel_built:
+            QTimer.singleShot(0, self._build_secondary_panel)
+
+    def closeEvent(self, event):
+        # 退出前等待后台解码线程结束，避免回调到已销毁的对象。
+        self.prefetcher.shutdown()
+        self.annotation_writer.flush()
+        self._flush_meta()
+        self._cancel_status_scan()
+        self._cancel_image_scan()
+        QThreadPool.globalInstance().waitForDone()
+        super().closeEvent(event)
 
     def _setup_shortcuts(self):
         """使用 QShortcut 注册全局快捷键，避免焦点切换导致快捷键失效。"""
         QShortcut(QKeySequence(Qt.Key_Left), self, self.prev_image)
         QShortcut(QKeySequence(Qt.Key_Right), self, self.next_image)
         QShortcut(QKeySequence(Qt.Key_O), self, self.next_processable_image)
-        QShortcut(QKeySequence(Qt.Key_Tab), self, lambda: self.switch_keypoint(1))
+        QShortcut(QKeySequence(Qt.Key_Tab), self, partial(self.switch_keypoint, 1))
         QShortcut(
             QKeySequence(Qt.ShiftModifier | Qt.Key_Tab),
             self,
-            lambda: self.switch_keypoint(-1),
+            partial(self.switch_keypoint, -1),
         )
         QShortcut(QKeySequence(Qt.Key_H), self, self.toggle_skeleton)
         QShortcut(QKeySequence(Qt.Key_Delete), self, self.move_to_ignore)
         QShortcut(QKeySequence(Qt.Key_W), self, self.focus_on_pose)
         QShortcut(QKeySequence(Qt.Key_E), self, self.fit_to_window)
         # 数字快捷键 1..5 对应预设丢弃理由。
-        for idx, category in enumerate(IGNORE_CATEGORIES, start=1):
-            key = getattr(Qt, f"Key_{idx}")
+        for key, category in zip(_DIGIT_KEYS, IGNORE_CATEGORIES):
             QShortcut(
-                QKeySequence(key),
-                self,
-                lambda reason=category: self.move_to_ignore_category(reason),
+                QKeySequence(key), self, partial(self.move_to_ignore_category, category)
             )
-        # S/D/Space 用于切换可见性，需要转发给画布控件
-        QShortcut(
-            QKeySequence(Qt.Key_S),
-            self,
-            lambda: self._apply_visibility_shortcut(Qt.Key_S),
-        )
-        QShortcut(
-            QKeySequence(Qt.Key_D),
-            self,
-            lambda: self._apply_visibility_shortcut(Qt.Key_D),
-        )
-        QShortcut(
-            QKeySequence(Qt.Key_Space),
-            self,
-            lambda: self._apply_visibility_shortcut(Qt.Key_Space),
-        )
-
-    def _apply_visibility_shortcut(self, key: int):
-        self.canvas.keyPressEvent(QKeyEvent(QEvent.KeyPress, key, Qt.NoModifier))
-        self.update_keypoint_list()
-        self.update_status()
+        # S/D/Space 直接调用画布的可见性操作；列表由 keypoint_changed 信号逐行刷新。
+        QShortcut(QKeySequence(Qt.Key_S), self, partial(self.canvas.set_visibility, 0))
+        QShortcut(QKeySequence(Qt.Key_D), self, partial(self.canvas.set_visibility, 1))
+        QShortcut(QKeySequence(Qt.Key_Space), self, self.canvas.toggle_visibility)
 
     def switch_keypoint(self, direction: int):
         if not self.canvas.pose_data.keypoints:
             return
-        current_idx = -1
-        if self.canvas.selected_keypoint:
-            try:
-                current_idx = self.canvas.pose_data.keypoints.index(
-                    self.canvas.selected_keypoint
-                )
-            except ValueError:
-                pass
+        current_idx = self.canvas.selected_index
+        if current_idx is None:
+            current_idx = -1
         new_idx = (current_idx + direction) % len(self.canvas.pose_data.keypoints)
-        self.canvas.selected_keypoint = self.canvas.pose_data.keypoints[new_idx]
+        self.canvas.selected_index = new_idx
         self.canvas.update()
-        self.on_keypoint_selected(self.canvas.selected_keypoint.name)
+        self.on_keypoint_selected(
+            self.canvas.pose_data.keypoints[new_idx].name, new_idx
+        )
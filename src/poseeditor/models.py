@@ -1,11 +1,15 @@
 """关键点与姿态标注的数据模型。"""
 
-from typing import Any, Dict, List, Tuple
+import math
+from typing import Any, Dict, List, Optional, Tuple
 
 
 class Keypoint:
     """关键点数据模型"""
 
+    # 每个姿态有 17 个关键点，省去逐实例的 __dict__。
+    __slots__ = ("name", "x", "y", "visibility")
+
     def __init__(self, name: str, x: float = 0, y: float = 0, visibility: int = 0):
         self.name = name
         self.x = x
@@ -15,6 +19,13 @@ class Keypoint:
     def copy(self) -> "Keypoint":
         return Keypoint(self.name, self.x, self.y, self.visibility)
 
+    def state(self) -> Tuple[float, float, int]:
+        """可编辑状态的快照 (x, y, visibility)，供撤销记录使用。"""
+        return (self.x, self.y, self.visibility)
+
+    def set_state(self, state: Tuple[float, float, int]):
+        self.x, self.y, self.visibility = state
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "name": self.name,
@@ -31,6 +42,18 @@ class Keypoint:
 class PoseData:
     """姿态数据模型，支持 COCO 风格 JSON 标注格式。"""
 
+    __slots__ = (
+        "keypoints",
+        "raw_id",
+        "raw_scores",
+        "novelty",
+        "environment_interaction",
+        "person_fit",
+        "skip_reason",
+        "time_spent",
+        "score",
+    )
+
     KEYPOINT_NAMES = [
         "nose",
         "left_eye",
@@ -51,8 +74,9 @@ class PoseData:
         "right_ankle",
     ]
 
-    def __init__(self):
-        self.keypoints = self._init_keypoints()
+    def __init__(self, keypoints: Optional[List[Keypoint]] = None):
+        # 传入关键点列表时直接使用，省去先创建一组默认关键点再丢弃。
+        self.keypoints = keypoints if keypoints is not None else self._init_keypoints()
 
         # 保留原始检测数据（模型输出，不可修改）
         self.raw_id = 0
@@ -73,8 +97,7 @@ class PoseData:
         self.score = -1
 
     def copy(self) -> "PoseData":
-        new_pose = PoseData()
-        new_pose.keypoints = [kp.copy() for kp in self.keypoints]
+        new_pose = PoseData([kp.copy() for kp in self.keypoints])
         new_pose.raw_id = self.raw_id
         new_pose.raw_scores = self.raw_scores.copy()
         new_pose.score = self.score
@@ -146,20 +169,37 @@ class PoseData:
 
         return pose
 
+    def needs_processing(self) -> bool:
+        """未标记跳过且三项评分未全部完成时，图片仍需处理。"""
+        if self.skip_reason:
+            return False
+        return (
+            self.novelty < 0 or self.environment_interaction < 0 or self.person_fit < 0
+        )
+
     def has_valid_keypoints(self) -> bool:
         """检查是否有有效的关键点坐标（不全为0）"""
-        for kp in self.keypoints:
-            if kp.x > 1 and kp.y > 1:  # 简单的阈值判断
-                return True
-        return False
+        # 简单的阈值判断，命中第一个有效点即返回。
+        return any(kp.x > 1 and kp.y > 1 for kp in self.keypoints)
 
     def get_bounding_box(self) -> Tuple[float, float, float, float]:
         """获取有效关键点包围盒，返回最小与最大坐标。"""
-        valid_points = [(kp.x, kp.y) for kp in self.keypoints if kp.x > 1 and kp.y > 1]
-        xs = [x for x, _ in valid_points]
-        ys = [y for _, y in valid_points]
-
-        if not xs or not ys:
+        # 单次遍历同时维护最小/最大值，不构造中间列表。
+        min_x = min_y = math.inf
+        max_x = max_y = -math.inf
+        for kp in self.keypoints:
+            x, y = kp.x, kp.y
+            if x > 1 and y > 1:
+                if x < min_x:
+                    min_x = x
+                if x > max_x:
+                    max_x = x
+                if y < min_y:
+                    min_y = y
+                if y > max_y:
+                    max_y = y
+
+        if min_x == math.inf:
             return (0, 0, 0, 0)
 
-        return (min(xs), min(ys), max(xs), max(ys))
+        return (min_x, min_y, max_x, max_y)
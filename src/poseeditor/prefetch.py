@@ -0,0 +1,283 @@
+"""后台预读相邻图片及其标注，缩短翻页时的等待。"""
+
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from PySide6.QtCore import QObject, QRunnable, QSize, Qt, QThreadPool, Signal
+from PySide6.QtGui import QImage, QImageReader
+
+from .jsonio import read_json
+
+
+# 长边超过该像素数的图片在解码阶段即缩小，远超屏幕所需的细节不再解码。
+MAX_DECODE_SIDE = 4096
+
+
+def decode_image(path: str, max_side: int = MAX_DECODE_SIDE) -> QImage:
+    """解码图片，过大的图片借助解码器按比例缩小。
+
+    返回图片的 devicePixelRatio 记录解码缩放比例，因此
+    deviceIndependentSize() 始终等于原图尺寸，标注坐标仍以原图像素为单位。
+    无法识别文件头的图片直接返回空 QImage，不再尝试解码。
+    """
+    reader = QImageReader(path)
+    if not reader.canRead():
+        return QImage()
+    source_size = reader.size()
+    longest = max(source_size.width(), source_size.height())
+    ratio = 1.0
+    if longest > max_side:
+        ratio = max_side / longest
+        reader.setScaledSize(
+            QSize(
+                max(1, round(source_size.width() * ratio)),
+                max(1, round(source_size.height() * ratio)),
+            )
+        )
+    image = reader.read()
+    if not image.isNull():
+        image.setDevicePixelRatio(ratio)
+    return image
+
+
+def decode_image_to_fit(path: str, width: int, height: int) -> QImage:
+    """按比例解码到恰好放入 width x height 的尺寸，供预览使用。
+
+    由解码器直接输出目标尺寸（JPEG 可在 DCT 阶段缩小），不必先解码原图再缩放。
+    读取器无法识别格式时回退为完整解码后平滑缩放。
+    """
+    reader = QImageReader(path)
+    if not reader.canRead():
+        image = QImage(path)
+        if image.isNull():
+            return image
+        return image.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    target = reader.size().scaled(width, height, Qt.KeepAspectRatio)
+    if not target.isEmpty():
+        reader.setScaledSize(target)
+    return reader.read()
+
+
+class _LoaderSignals(QObject):
+    # QRunnable 不是 QObject，借助该对象把结果排队送回主线程。
+    # 图片路径、解码结果、标注读取结果（见 ImageLoader.run）。
+    loaded = Signal(str, QImage, object)
+
+
+class ImageLoader(QRunnable):
+    """在线程池中解码单张图片并读取其标注（QImage 可在非 GUI 线程构造）。"""
+
+    def __init__(
+        self, path: str, annotation_path: Optional[str], signals: _LoaderSignals
+    ):
+        super().__init__()
+        self.path = path
+        self.annotation_path = annotation_path
+        self.signals = signals
+
+    def run(self):
+        # 标注结果为 (是否读取成功, 数据)；文件不存在视为成功读取到 None，
+        # 读取或解析失败则交给主线程的同步流程重新处理并报告错误。
+        annotation: Tuple[bool, Any] = (False, None)
+        if self.annotation_path is not None:
+            try:
+                if os.path.exists(self.annotation_path):
+                    annotation = (True, read_json(self.annotation_path))
+                else:
+                    annotation = (True, None)
+            except Exception:
+                pass
+        self.signals.loaded.emit(self.path, decode_image(self.path), annotation)
+
+
+class _PreviewSignals(QObject):
+    # (图片路径, 宽, 高)、解码结果。
+    loaded = Signal(object, QImage)
+
+
+class PreviewLoader(QRunnable):
+    """在线程池中把参考图解码到预览尺寸。"""
+
+    def __init__(self, key: Tuple[str, int, int], signals: _PreviewSignals):
+        super().__init__()
+        self.key = key
+        self.signals = signals
+
+    def run(self):
+        path, width, height = self.key
+        self.signals.loaded.emit(self.key, decode_image_to_fit(path, width, height))
+
+
+class ScanSignals(QObject):
+    # 扫描批次号、{图片路径: (标注路径, 结果)}。
+    finished = Signal(int, object)
+
+
+class AnnotationScanner(QRunnable):
+    """后台批量读取标注文件，并按图片路径汇总 evaluate(标注内容) 的结果。
+
+    每张图片给出若干候选标注路径，按顺序取第一个存在的文件，
+    存在性检查也在后台完成。结果为 (实际读取的标注路径, 结果)；
+    候选文件都不存在时为 (None, None)。读取失败的图片不计入结果，
+    留给主线程按需同步读取并报告错误。
+    """
+
+    MAX_WORKERS = 8
+
+    def __init__(
+        self,
+        generation: int,
+        items: List[Tuple[str, Tuple[str, ...]]],
+        evaluate: Callable[[Any], Any],
+        signals: ScanSignals,
+    ):
+        super().__init__()
+        self.generation = generation
+        self.items = items
+        self.evaluate = evaluate
+        self.signals = signals
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def _scan_one(self, item: Tuple[str, Tuple[str, ...]]):
+        if self._cancelled:
+            return None
+        path, candidates = item
+        for annotation_path in candidates:
+            # 直接尝试打开，不存在时换下一个候选，省去单独的 stat。
+            try:
+                data = read_json(annotation_path)
+            except FileNotFoundError:
+                continue
+            except Exception:
+                return None
+            try:
+                return path, (annotation_path, self.evaluate(data))
+            except Exception:
+                return None
+        return path, (None, None)
+
+    def run(self):
+        # 小文件读取以 IO 为主，多线程并行可以缩短整体等待。
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            results = dict(r for r in executor.map(self._scan_one, self.items) if r)
+        if not self._cancelled:
+            self.signals.finished.emit(self.generation, results)
+
+
+class ImagePrefetcher(QObject):
+    """按路径缓存最近解码的图片，并在后台预读即将浏览的图片及其标注。
+
+    所有缓存只在主线程读写，后台结果经排队信号送回，因此无需加锁。
+    """
+
+    CAPACITY = 3  # 上一张、当前、下一张
+
+    def __init__(self, capacity: int = CAPACITY, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.capacity = capacity
+        self._cache: "OrderedDict[str, QImage]" = OrderedDict()
+        self._pending: Set[str] = set()
+        # 预读到的标注数据，取用一次后即移除，避免与后续保存的内容不一致。
+        self._annotations: Dict[str, Any] = {}
+        # 后台读取期间标注被改写的路径，其读取结果已过期，只保留图片。
+        self._stale_annotations: Set[str] = set()
+        self._signals = _LoaderSignals(self)
+        self._signals.loaded.connect(self._on_loaded)
+        # 预读的参考图预览，(路径, 宽, 高) -> QImage；QPixmap 只能在主线程创建，由调用方转换。
+        self._previews: "OrderedDict[Tuple[str, int, int], QImage]" = OrderedDict()
+        self._pending_previews: Set[Tuple[str, int, int]] = set()
+        self._preview_signals = _PreviewSignals(self)
+        self._preview_signals.loaded.connect(self._on_preview_loaded)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(2)
+
+    def get(self, path: str) -> Optional[QImage]:
+        """命中缓存时返回图片并标记为最近使用，否则返回 None。"""
+        image = self._cache.get(path)
+        if image is not None:
+            self._cache.move_to_end(path)
+        return image
+
+    def put(self, path: str, image: QImage):
+        self._cache[path] = image
+        self._cache.move_to_end(path)
+        while len(self._cache) > self.capacity:
+            self._cache.popitem(last=False)
+
+    def take_annotation(self, path: str) -> Tuple[bool, Any]:
+        """取出预读的标注，返回 (是否命中, 数据)；数据为 None 表示标注文件不存在。"""
+        if path in self._annotations:
+            return True, self._annotations.pop(path)
+        return False, None
+
+    def discard_annotation(self, path: str):
+        """标注文件被写入后丢弃预读结果，包括仍在后台读取的任务。"""
+        self._annotations.pop(path, None)
+        if path in self._pending:
+            self._stale_annotations.add(path)
+
+    def discard(self, path: str):
+        """文件被移动或删除后清除对应缓存。"""
+        self._cache.pop(path, None)
+        self._annotations.pop(path, None)
+        self._pending.discard(path)
+        self._stale_annotations.discard(path)
+
+    def prefetch(self, items: Iterable[Tuple[str, Optional[str]]]):
+        """预读 (图片路径, 标注路径) 序列，已缓存或正在读取的图片会被跳过。"""
+        for path, annotation_path in items:
+            if path in self._cache or path in self._pending:
+                continue
+            self._pending.add(path)
+            self._pool.start(ImageLoader(path, annotation_path, self._signals))
+
+    def prefetch_previews(self, keys: Iterable[Tuple[str, int, int]]):
+        """按 (路径, 宽, 高) 在后台把参考图解码到预览尺寸。"""
+        for key in keys:
+            if key in self._previews or key in self._pending_previews:
+                continue
+            self._pending_previews.add(key)
+            self._pool.start(PreviewLoader(key, self._preview_signals))
+
+    def take_preview(self, key: Tuple[str, int, int]) -> Optional[QImage]:
+        """取出预读的预览图，未命中时返回 None。"""
+        return self._previews.pop(key, None)
+
+    def shutdown(self):
+        """丢弃排队任务并等待正在执行的解码结束。"""
+        self._pool.clear()
+        self._pool.waitForDone()
+        self._pending.clear()
+        self._annotations.clear()
+        self._stale_annotations.clear()
+        self._pending_previews.clear()
+        self._previews.clear()
+
+    def _on_loaded(self, path: str, image: QImage, annotation: Tuple[bool, Any]):
+        # 只有仍在等待中的结果才入缓存，期间被 discard 的路径会被忽略。
+        if path not in self._pending:
+            return
+        self._pending.discard(path)
+        found, data = annotation
+        if path in self._stale_annotations:
+            self._stale_annotations.discard(path)
+        elif found:
+            self._annotations[path] = data
+        # 损坏图片不缓存，交给主线程的同步加载流程处理。
+        if not image.isNull():
+            self.put(path, image)
+
+    def _on_preview_loaded(self, key: Tuple[str, int, int], image: QImage):
+        if key not in self._pending_previews:
+            return
+        self._pending_previews.discard(key)
+        if image.isNull():
+            return
+        self._previews[key] = image
+        while len(self._previews) > self.capacity:
+            self._previews.popitem(last=False)
@@ -1,85 +1,167 @@
 """姿态编辑用的撤销/重做命令栈。"""
 
-from PySide6.QtCore import QObject, Signal
+import time
+from collections import deque
+from typing import Optional, Tuple
 
-from .models import Keypoint, PoseData
+from PySide6.QtCore import QObject, QRect, Signal
+
+from .models import PoseData
+
+# 关键点可编辑状态 (x, y, visibility)，见 Keypoint.state()。
+KeypointState = Tuple[float, float, int]
 
 
 class UndoCommand:
     """撤销命令抽象基类。"""
 
+    __slots__ = ()
+
     def undo(self):
         pass
 
     def redo(self):
         pass
 
+    def merge_with(self, other: "UndoCommand") -> bool:
+        """尝试把紧随其后的命令合并进自身，成功返回 True。"""
+        return False
+
+    def is_obsolete(self) -> bool:
+        """合并后若前后状态相同，命令不再有意义，可从历史中移除。"""
+        return False
+
+    def changed_rect(self, canvas) -> Optional[QRect]:
+        """撤销/重做后画布上需要重绘的区域；返回 None 表示重绘整个画布。"""
+        return None
+
 
 class KeypointChangeCommand(UndoCommand):
+    __slots__ = ("pose_data", "keypoint_index", "old_state", "new_state")
+
     def __init__(
         self,
         pose_data: PoseData,
         keypoint_index: int,
-        old_state: Keypoint,
-        new_state: Keypoint,
+        old_state: KeypointState,
+        new_state: KeypointState,
     ):
         self.pose_data = pose_data
         self.keypoint_index = keypoint_index
         self.old_state = old_state
         self.new_state = new_state
 
-    def _update_keypoint(self, state: Keypoint):
-        current_kp = self.pose_data.keypoints[self.keypoint_index]
-        current_kp.x = state.x
-        current_kp.y = state.y
-        current_kp.visibility = state.visibility
-
     def undo(self):
-        self._update_keypoint(self.old_state)
+        self.pose_data.keypoints[self.keypoint_index].set_state(self.old_state)
 
     def redo(self):
-        self._update_keypoint(self.new_state)
+        self.pose_data.keypoints[self.keypoint_index].set_state(self.new_state)
+
+    def merge_with(self, other: UndoCommand) -> bool:
+        # 同一关键点的连续修改合并为一步，撤销时直接回到最初状态。
+        if (
+            not isinstance(other, KeypointChangeCommand)
+            or other.pose_data is not self.pose_data
+            or other.keypoint_index != self.keypoint_index
+        ):
+            return False
+        self.new_state = other.new_state
+        return True
+
+    def is_obsolete(self) -> bool:
+        return self.old_state == self.new_state
+
+    def changed_rect(self, canvas) -> Optional[QRect]:
+        # 只有命令作用于画布当前显示的姿态时，局部区域才有意义。
+        if canvas.pose_data is not self.pose_data:
+            return None
+        return canvas.keypoint_dirty_rect(
+            self.keypoint_index, self.old_state, self.new_state
+        )
 
 
 class UndoStack(QObject):
-    """轻量撤销栈：新命令入栈时会清空重做栈。"""
+    """轻量撤销栈：新命令入栈时会清空重做栈。
+
+    历史深度有上限，超出后自动丢弃最早的记录；在合并窗口内连续推入、
+    且可以合并的命令会并入栈顶命令，而不是各占一步。
+    """
 
     can_undo_changed = Signal(bool)
     can_redo_changed = Signal(bool)
 
-    def __init__(self):
+    MAX_DEPTH = 200
+    MERGE_WINDOW = 0.4  # 秒
+
+    def __init__(
+        self, max_depth: int = MAX_DEPTH, merge_window: float = MERGE_WINDOW
+    ):
         super().__init__()
-        self.undo_stack = []
-        self.redo_stack = []
+        self.undo_stack = deque(maxlen=max_depth)
+        self.redo_stack = deque(maxlen=max_depth)
+        self.merge_window = merge_window
+        self._last_push_time: Optional[float] = None
+        # 最近一次 undo()/redo() 执行的命令，供调用方决定重绘范围。
+        self.last_applied: Optional[UndoCommand] = None
+        # 最近一次对外通知的状态，只在状态翻转时发信号。
+        self._can_undo = False
+        self._can_redo = False
+
+    def _notify_state(self):
+        can_undo = bool(self.undo_stack)
+        can_redo = bool(self.redo_stack)
+        if can_undo != self._can_undo:
+            self._can_undo = can_undo
+            self.can_undo_changed.emit(can_undo)
+        if can_redo != self._can_redo:
+            self._can_redo = can_redo
+            self.can_redo_changed.emit(can_redo)
 
     def push(self, command: UndoCommand):
+        now = time.monotonic()
+        if (
+            self.undo_stack
+            and self._last_push_time is not None
+            and now - self._last_push_time < self.merge_window
+            and self.undo_stack[-1].merge_with(command)
+        ):
+            self._last_push_time = now
+            if self.undo_stack[-1].is_obsolete():
+                # 例如快速连按两次空格：合并后等于没改，直接丢弃这一步。
+                self.undo_stack.pop()
+                self._last_push_time = None
+                self._notify_state()
+            return
         self.undo_stack.append(command)
         self.redo_stack.clear()
-        self.can_undo_changed.emit(True)
-        self.can_redo_changed.emit(False)
+        self._last_push_time = now
+        self._notify_state()
 
     def undo(self) -> bool:
         if not self.undo_stack:
             return False
         command = self.undo_stack.pop()
+        self._last_push_time = None
         command.undo()
+        self.last_applied = command
         self.redo_stack.append(command)
-        self.can_undo_changed.emit(bool(self.undo_stack))
-        self.can_redo_changed.emit(True)
+        self._notify_state()
         return True
 
     def redo(self) -> bool:
         if not self.redo_stack:
             return False
         command = self.redo_stack.pop()
+        self._last_push_time = None
         command.redo()
+        self.last_applied = command
         self.undo_stack.append(command)
-        self.can_undo_changed.emit(True)
-        self.can_redo_changed.emit(bool(self.redo_stack))
+        self._notify_state()
         return True
 
     def clear(self):
         self.undo_stack.clear()
         self.redo_stack.clear()
-        self.can_undo_changed.emit(False)
-        self.can_redo_changed.emit(False)
+        self._last_push_time = None
+        self.last_applied = None
+        self._notify_state()
@@ -1,6 +1,7 @@
 """项目自定义控件集合。"""
 
 from .canvas import Canvas
+from .keypoint_list import KeypointListModel
 from .tooltip import DelayedTooltipFilter
 
-__all__ = ["Canvas", "DelayedTooltipFilter"]
+__all__ = ["Canvas", "DelayedTooltipFilter", "KeypointListModel"]
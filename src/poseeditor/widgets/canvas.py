@@ -1,8 +1,9 @@
 """负责图像显示与关键点交互的画布控件。"""
 
-from typing import Optional
+import math
+from typing import List, Optional, Tuple
 
-from PySide6.QtCore import QPointF, Qt, Signal
+from PySide6.QtCore import QLineF, QPointF, QRect, QRectF, QSizeF, Qt, QTimer, Signal
 from PySide6.QtGui import (
     QBrush,
     QColor,
@@ -11,16 +12,39 @@ from PySide6.QtGui import (
     QMouseEvent,
     QPainter,
     QPen,
+    QPixmap,
+    QPixmapCache,
+    QTransform,
     QWheelEvent,
 )
 from PySide6.QtWidgets import QWidget
 
 from ..models import Keypoint, PoseData
-from ..undo import KeypointChangeCommand, UndoStack
+from ..undo import KeypointChangeCommand, KeypointState, UndoStack
+
+
+def _group_edges_by_color(edges, colors):
+    """把颜色相同的骨骼归为一组，返回 ((颜色, (骨骼, ...)), ...)。"""
+    groups = {}
+    for edge in edges:
+        color = colors[edge]
+        groups.setdefault(color.rgba(), (color, []))[1].append(edge)
+    return tuple((color, tuple(group)) for color, group in groups.values())
+
+
+def _edge_neighbors(edges, count):
+    """返回每个关键点经骨骼相连的其他关键点下标。"""
+    neighbors = [[] for _ in range(count)]
+    for start, end in edges:
+        neighbors[start].append(end)
+        neighbors[end].append(start)
+    return tuple(tuple(n) for n in neighbors)
 
 
 class Canvas(QWidget):
-    keypoint_selected = Signal(str)
+    keypoint_selected = Signal(str, int)
+    # 画布上的编辑改变了某个关键点（参数为下标）。
+    keypoint_changed = Signal(int)
 
     def __init__(self):
         super().__init__()
@@ -28,55 +52,79 @@ class Canvas(QWidget):
         self.pose_data = PoseData()
         self.scale = 1.0
         self.offset = QPointF(0, 0)
-        self.selected_keypoint: Optional[Keypoint] = None
+        # 最近一次“适应窗口”得到的缩放，用于判断能否复用缩小后的位图。
+        self._fit_scale: Optional[float] = None
+        # 以下标记录选中的关键点，事件处理时无需再在列表中查找。
+        self.selected_index: Optional[int] = None
         self.dragging = False
         self.panning = False
         self.last_pos = QPointF()
         self.show_skeleton = True
         self.keypoint_opacity = 1.0
         self.undo_stack = UndoStack()
+        # 自上次加载或保存以来标注是否被修改过。
+        self.dirty = False
         self.drag_start_pos: Optional[QPointF] = None
 
-        self.skeleton = [
-            (0, 1),
-            (0, 2),
-            (1, 3),
-            (2, 4),
-            (5, 6),
-            (5, 7),
-            (7, 9),
-            (6, 8),
-            (8, 10),
-            (5, 11),
-            (6, 12),
-            (11, 12),
-            (11, 13),
-            (13, 15),
-            (12, 14),
-            (14, 16),
-        ]
+        # 标记画笔宽度固定，创建一次后在绘制时复用。
+        self._marker_border_pen = QPen(QColor(0, 0, 0), self.MARKER_PEN_WIDTH)
+        self._cross_pen = QPen(QColor(0, 0, 0), self.MARKER_PEN_WIDTH * 2)
+        self._cross_pen.setCapStyle(Qt.RoundCap)
+        self._selected_brush = QBrush(QColor(255, 255, 0))
+        # 遮挡点叉形的半边长（控件像素）。
+        self._cross_size = self.MARKER_RADIUS * 0.9
+        # 画笔/画刷缓存：(生成时的缩放或不透明度, 对象列表)。
+        self._skeleton_pen_cache: Tuple[Optional[float], List[QPen]] = (None, [])
+        self._marker_brush_cache: Tuple[Optional[float], List[QBrush]] = (None, [])
+
+        # 全局位图缓存默认仅 10MB，放大以容纳若干张适应窗口尺寸的位图。
+        if QPixmapCache.cacheLimit() < self.PIXMAP_CACHE_LIMIT_KB:
+            QPixmapCache.setCacheLimit(self.PIXMAP_CACHE_LIMIT_KB)
+        # 滚轮缩放停下后再生成当前比例的平滑缩小位图，缩放过程中不逐级生成。
+        self._scaled_pixmap_timer = QTimer(self)
+        self._scaled_pixmap_timer.setSingleShot(True)
+        self._scaled_pixmap_timer.setInterval(self.SCALED_PIXMAP_DELAY_MS)
+        self._scaled_pixmap_timer.timeout.connect(self._build_scaled_pixmap)
 
         self.setMinimumSize(800, 600)
         self.setMouseTracking(True)
         self.setFocusPolicy(Qt.StrongFocus)
 
+    @property
+    def selected_keypoint(self) -> Optional[Keypoint]:
+        if self.selected_index is None:
+            return None
+        return self.pose_data.keypoints[self.selected_index]
+
     def set_image(self, image: QImage):
+        # 同一对象重复设置时无需触发重绘。
+        if image is self.image:
+            return
         self.image = image
+        self._fit_scale = None
         self.update()
 
     def set_pose_data(self, pose_data: PoseData):
+        if pose_data is self.pose_data:
+            return
         self.pose_data = pose_data
+        self.dirty = False
         self.update()
 
+    def image_size(self) -> QSizeF:
+        """原图尺寸（图像坐标系）；大图可能以较低分辨率解码，见 decode_image。"""
+        return self.image.deviceIndependentSize()
+
     def fit_to_window(self):
         """适应窗口大小 (显示全图)"""
         if not self.image:
             return
         widget_size = self.size()
-        image_size = self.image.size()
+        image_size = self.image_size()
         scale_x = widget_size.width() / image_size.width()
         scale_y = widget_size.height() / image_size.height()
         self.scale = min(scale_x, scale_y) * 0.9
+        self._fit_scale = self.scale
         scaled_size = image_size * self.scale
         self.offset = QPointF(
             (widget_size.width() - scaled_size.width()) / 2,
@@ -85,11 +133,12 @@ class Canvas(QWidget):
         self.update()
 
     def focus_on_pose(self):
-        """聚焦于姿态所在的局部区域"""
-        if not self.image or not self.pose_data.has_valid_keypoints():
-            self.fit_to_window()
+        """聚焦于姿态所在的局部区域；没有有效关键点时显示全图。"""
+        if not self.image:
             return
 
+        # 没有有效关键点时包围盒为 (0, 0, 0, 0)，会走下面的尺寸过小分支，
+        # 因此只需遍历一次关键点。
         min_x, min_y, max_x, max_y = self.pose_data.get_bounding_box()
 
         bbox_w = max_x - min_x
@@ -137,15 +186,104 @@ class Canvas(QWidget):
             (point.y() - self.offset.y()) / self.scale,
         )
 
-    def get_keypoint_at(self, pos: QPointF) -> Optional[Keypoint]:
+    def keypoint_widget_coords(self) -> List[Tuple[float, float]]:
+        """一次性把全部关键点映射到控件坐标，供绘制与命中测试复用。"""
+        scale = self.scale
+        ox = self.offset.x()
+        oy = self.offset.y()
+        return [
+            (kp.x * scale + ox, kp.y * scale + oy) for kp in self.pose_data.keypoints
+        ]
+
+    def get_keypoint_at(self, pos: QPointF) -> Optional[int]:
+        """返回与控件坐标 pos 的直线距离在 10 像素内且最近的关键点下标。"""
         if not self.image:
             return None
-        for kp in self.pose_data.keypoints:
-            kp_pos = self.image_to_widget(QPointF(kp.x, kp.y))
-            distance = (kp_pos - pos).manhattanLength()
-            if distance < 10:
-                return kp
-        return None
+        # 只把点击位置反算到图片坐标一次，阈值同样换算到图片像素，
+        # 关键点坐标无需逐个映射到控件坐标。
+        scale = self.scale
+        px = (pos.x() - self.offset.x()) / scale
+        py = (pos.y() - self.offset.y()) / scale
+        best_index = None
+        # 比较欧氏距离的平方，省去开方。
+        radius = 10 / scale
+        best_distance = radius * radius
+        for i, kp in enumerate(self.pose_data.keypoints):
+            dx = kp.x - px
+            distance = dx * dx
+            # 横向距离已超出阈值的点直接跳过，不再计算纵向距离。
+            if distance >= best_distance:
+                continue
+            dy = kp.y - py
+            distance += dy * dy
+            if distance < best_distance:
+                best_index = i
+                best_distance = distance
+        return best_index
+
+    PIXMAP_CACHE_LIMIT_KB = 64 * 1024
+    SCALED_PIXMAP_DELAY_MS = 150
+
+    def _scaled_pixmap_spec(
+        self,
+    ) -> Optional[Tuple[str, int, int, float, bool]]:
+        """返回当前缩放下缩小位图的 (缓存键, 宽, 高, 设备像素比, 是否为适应比例)。
+
+        宽高以设备像素计，高分屏上位图按物理像素生成，不会被再放大而变模糊。
+        按物理像素计已是放大显示时返回 None：放大后的位图过大，仍由绘制时变换。
+        """
+        scale = self.scale
+        dpr = self.devicePixelRatioF()
+        # 位图按原样绘制在 offset 处，尺寸必须与关键点所用的 scale 一致，
+        # 因此只有缩放确实等于适应比例时才算适应比例（容差只吸收浮点误差）。
+        fit_scale = self._fit_scale
+        is_fit = fit_scale is not None and math.isclose(scale, fit_scale, rel_tol=1e-9)
+        if scale * dpr >= 1:
+            return None
+        image_size = self.image_size()
+        width = round(image_size.width() * scale * dpr)
+        height = round(image_size.height() * scale * dpr)
+        key = f"poseeditor:scaled:{self.image.cacheKey()}:{width}x{height}@{dpr}"
+        return key, width, height, dpr, is_fit
+
+    def _make_scaled_pixmap(
+        self, key: str, width: int, height: int, dpr: float
+    ) -> QPixmap:
+        scaled = self.image.scaled(
+            width, height, Qt.IgnoreAspectRatio, Qt.SmoothTransformation
+        )
+        # 缩小结果按设备像素一比一绘制。
+        scaled.setDevicePixelRatio(dpr)
+        pixmap = QPixmap.fromImage(scaled)
+        QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    def _scaled_pixmap(self) -> Optional[QPixmap]:
+        """返回按当前比例缩小后的位图；尚未生成时返回 None，由调用方直接变换绘制。
+
+        适应窗口的比例立即生成；其他比例（如滚轮缩放中）延迟到缩放停下后再生成。
+        """
+        spec = self._scaled_pixmap_spec()
+        if spec is None:
+            return None
+        key, width, height, dpr, is_fit = spec
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            if is_fit:
+                return self._make_scaled_pixmap(key, width, height, dpr)
+            self._scaled_pixmap_timer.start()
+        return pixmap
+
+    def _build_scaled_pixmap(self):
+        if not self.image:
+            return
+        spec = self._scaled_pixmap_spec()
+        if spec is None:
+            return
+        key, width, height, dpr, _ = spec
+        if QPixmapCache.find(key) is None:
+            self._make_scaled_pixmap(key, width, height, dpr)
+            self.update()
 
     def paintEvent(self, _event):
         painter = QPainter(self)
@@ -155,15 +293,45 @@ class Canvas(QWidget):
         if not self.image:
             return
 
-        painter.save()
-        painter.translate(self.offset)
-        painter.scale(self.scale, self.scale)
-        painter.drawImage(0, 0, self.image)
-        painter.restore()
+        # 缩小显示时直接绘制缓存的缩小位图，避免每帧缩放整张原图。
+        scaled_pixmap = self._scaled_pixmap()
+        if scaled_pixmap is not None:
+            painter.drawPixmap(self.offset, scaled_pixmap)
+        else:
+            # 一次设置完整的图片到控件变换，画完即复位，无需保存整套画笔状态。
+            scale = self.scale
+            painter.setWorldTransform(
+                QTransform(scale, 0, 0, scale, self.offset.x(), self.offset.y())
+            )
+            # 按原图尺寸绘制，低分辨率解码的大图也与标注坐标对齐。
+            painter.drawImage(QRectF(QPointF(0, 0), self.image_size()), self.image)
+            painter.resetTransform()
 
+        # 骨架与关键点直接在控件坐标系绘制，避免每个图元都经过画笔变换。
+        coords = self.keypoint_widget_coords()
         if self.show_skeleton:
-            self.draw_skeleton(painter)
-        self.draw_keypoints(painter)
+            self.draw_skeleton(painter, coords)
+        self.draw_keypoints(painter, coords)
+
+    # 骨骼连接（关键点下标对），所有实例共享。
+    SKELETON = (
+        (0, 1),
+        (0, 2),
+        (1, 3),
+        (2, 4),
+        (5, 6),
+        (5, 7),
+        (7, 9),
+        (6, 8),
+        (8, 10),
+        (5, 11),
+        (6, 12),
+        (11, 12),
+        (11, 13),
+        (13, 15),
+        (12, 14),
+        (14, 16),
+    )
 
     # 骨骼连接的颜色分类
     SKELETON_COLORS = {
@@ -185,23 +353,32 @@ class Canvas(QWidget):
         (14, 16): QColor(120, 170, 245, 150),
     }
 
-    def draw_skeleton(self, painter: QPainter):
+    # 同色骨骼分为一组，绘制时每组只设置一次画笔并一次提交全部线段。
+    SKELETON_COLOR_GROUPS = _group_edges_by_color(SKELETON, SKELETON_COLORS)
+
+    # 与每个关键点相连的关键点，用于计算单点变化时的局部重绘区域。
+    SKELETON_NEIGHBORS = _edge_neighbors(SKELETON, len(PoseData.KEYPOINT_NAMES))
+
+    def _skeleton_pens(self) -> List[QPen]:
+        """按当前缩放返回每个颜色分组的画笔，缩放不变时直接复用。"""
+        if self._skeleton_pen_cache[0] != self.scale:
+            width = 2 * self.scale
+            pens = [QPen(color, width) for color, _ in self.SKELETON_COLOR_GROUPS]
+            self._skeleton_pen_cache = (self.scale, pens)
+        return self._skeleton_pen_cache[1]
+
+    def draw_skeleton(self, painter: QPainter, coords: List[Tuple[float, float]]):
         if not self.image:
             return
-        painter.save()
-        painter.translate(self.offset)
-        painter.scale(self.scale, self.scale)
-        for start_idx, end_idx in self.skeleton:
-            start_kp = self.pose_data.keypoints[start_idx]
-            end_kp = self.pose_data.keypoints[end_idx]
-            color = self.SKELETON_COLORS.get(
-                (start_idx, end_idx), QColor(100, 200, 100, 150)
-            )
-            painter.setPen(QPen(color, 2))
-            painter.drawLine(
-                QPointF(start_kp.x, start_kp.y), QPointF(end_kp.x, end_kp.y)
+        for pen, (_, edges) in zip(self._skeleton_pens(), self.SKELETON_COLOR_GROUPS):
+            painter.setPen(pen)
+            painter.drawLines(
+                [QLineF(*coords[start], *coords[end]) for start, end in edges]
             )
-        painter.restore()
+
+    # 关键点标记在控件坐标系下的尺寸（像素），不随缩放变化。
+    MARKER_RADIUS = 5
+    MARKER_PEN_WIDTH = 1.5
 
     KEYPOINT_COLORS = {
         0: QColor(100, 220, 100),
@@ -223,65 +400,109 @@ class Canvas(QWidget):
         16: QColor(140, 160, 240),
     }
 
-    def draw_keypoints(self, painter: QPainter):
+    def _marker_brushes(self) -> List[QBrush]:
+        """按当前不透明度返回每个关键点的填充画刷，不透明度不变时直接复用。"""
+        opacity = self.keypoint_opacity
+        if self._marker_brush_cache[0] != opacity:
+            alpha = int(255 * opacity)
+            brushes = []
+            for i in range(len(PoseData.KEYPOINT_NAMES)):
+                # 复制颜色再改透明度，避免修改类级共享的颜色表。
+                color = QColor(self.KEYPOINT_COLORS.get(i, QColor(200, 200, 200)))
+                color.setAlpha(alpha)
+                brushes.append(QBrush(color))
+            self._marker_brush_cache = (opacity, brushes)
+        return self._marker_brush_cache[1]
+
+    def draw_keypoints(self, painter: QPainter, coords: List[Tuple[float, float]]):
         if not self.image:
             return
-        painter.save()
-        painter.translate(self.offset)
-        painter.scale(self.scale, self.scale)
-
-        selected_color = QColor(255, 255, 0)
-        selected_border = QColor(0, 0, 0)
-        normal_border = QColor(0, 0, 0)
 
+        # 按可见性分桶：同一类标记只切换一次画笔状态。
+        visible = []
+        occluded = []
         for i, kp in enumerate(self.pose_data.keypoints):
-            is_selected = self.selected_keypoint == kp
-            base_color = self.KEYPOINT_COLORS.get(i, QColor(200, 200, 200))
-            base_color.setAlpha(int(255 * self.keypoint_opacity))
-            fill_color = selected_color if is_selected else base_color
-            border_color = selected_border if is_selected else normal_border
-
-            radius = 5 / self.scale
-            pen_width = 1.5 / self.scale
-
             if kp.visibility == 1:
-                painter.setBrush(QBrush(fill_color))
-                painter.setPen(QPen(border_color, pen_width))
-                painter.drawEllipse(QPointF(kp.x, kp.y), radius, radius)
-
+                visible.append(i)
             elif kp.visibility == 0:
-                cross_size = radius * 0.9
-                cross_pen = QPen(fill_color, pen_width * 2)
-                cross_pen.setCapStyle(Qt.RoundCap)
-                painter.setPen(cross_pen)
-                painter.setBrush(Qt.NoBrush)
-                painter.drawLine(
-                    QPointF(kp.x - cross_size, kp.y - cross_size),
-                    QPointF(kp.x + cross_size, kp.y + cross_size),
-                )
-                painter.drawLine(
-                    QPointF(kp.x - cross_size, kp.y + cross_size),
-                    QPointF(kp.x + cross_size, kp.y - cross_size),
-                )
+                occluded.append(i)
+
+        brushes = self._marker_brushes()
+        selected_index = self.selected_index
+
+        def fill_brush(i: int) -> QBrush:
+            if i == selected_index:
+                return self._selected_brush
+            return brushes[i]
+
+        radius = self.MARKER_RADIUS
+        painter.setPen(self._marker_border_pen)
+        for i in visible:
+            painter.setBrush(fill_brush(i))
+            painter.drawEllipse(QPointF(*coords[i]), radius, radius)
+
+        # 叉形直接以两条线段提交，不再为每个点复制并描边 QPainterPath。
+        cross_pen = self._cross_pen
+        c = self._cross_size
+        painter.setBrush(Qt.NoBrush)
+        for i in occluded:
+            cross_pen.setColor(fill_brush(i).color())
+            painter.setPen(cross_pen)
+            x, y = coords[i]
+            painter.drawLines(
+                [QLineF(x - c, y - c, x + c, y + c), QLineF(x - c, y + c, x + c, y - c)]
+            )
 
-        painter.restore()
+    def keypoint_dirty_rect(self, index: int, *states: KeypointState) -> QRect:
+        """关键点 index 处于各状态时，其标记与相连骨骼覆盖的控件区域之并集。"""
+        scale = self.scale
+        ox = self.offset.x()
+        oy = self.offset.y()
+        xs = []
+        ys = []
+        for x, y, _ in states:
+            xs.append(x * scale + ox)
+            ys.append(y * scale + oy)
+        if self.show_skeleton:
+            keypoints = self.pose_data.keypoints
+            for j in self.SKELETON_NEIGHBORS[index]:
+                xs.append(keypoints[j].x * scale + ox)
+                ys.append(keypoints[j].y * scale + oy)
+        # 标记半径、描边宽度、半条骨骼线宽，再留出抗锯齿余量。
+        pad = self.MARKER_RADIUS + self.MARKER_PEN_WIDTH * 2 + scale + 2
+        left = min(xs) - pad
+        top = min(ys) - pad
+        return QRectF(
+            left, top, max(xs) + pad - left, max(ys) + pad - top
+        ).toAlignedRect()
+
+    def _apply_undo(self, applied: bool) -> bool:
+        if not applied:
+            return False
+        rect = self.undo_stack.last_applied.changed_rect(self)
+        if rect is None:
+            self.update()
+        else:
+            self.update(rect)
+        self.dirty = True
+        return True
 
-    @staticmethod
-    def _state_changed(old_state: Keypoint, new_state: Keypoint) -> bool:
-        return (
-            old_state.x != new_state.x
-            or old_state.y != new_state.y
-            or old_state.visibility != new_state.visibility
-        )
+    def undo(self) -> bool:
+        """撤销一步，只重绘受影响的区域。"""
+        return self._apply_undo(self.undo_stack.undo())
+
+    def redo(self) -> bool:
+        """重做一步，只重绘受影响的区域。"""
+        return self._apply_undo(self.undo_stack.redo())
 
     def _push_keypoint_change(
         self,
         keypoint_index: int,
-        old_state: Keypoint,
-        new_state: Keypoint,
+        old_state: KeypointState,
+        new_state: KeypointState,
     ) -> bool:
         # 位置与可见性都没有变化时，不产生撤销记录，避免历史污染。
-        if not self._state_changed(old_state, new_state):
+        if old_state == new_state:
             return False
         command = KeypointChangeCommand(
             self.pose_data,
@@ -290,46 +511,60 @@ class Canvas(QWidget):
             new_state,
         )
         self.undo_stack.push(command)
+        self.dirty = True
+        self.keypoint_changed.emit(keypoint_index)
         return True
 
     def mousePressEvent(self, event: QMouseEvent):
         if event.button() == Qt.LeftButton:
             if event.modifiers() & Qt.ControlModifier:
-                if self.selected_keypoint:
+                keypoint_index = self.selected_index
+                if keypoint_index is not None:
+                    keypoint = self.pose_data.keypoints[keypoint_index]
                     image_pos = self.widget_to_image(event.pos())
-                    keypoint_index = self.pose_data.keypoints.index(
-                        self.selected_keypoint
-                    )
-                    old_state = self.selected_keypoint.copy()
+                    old_state = keypoint.state()
 
-                    self.selected_keypoint.x = image_pos.x()
-                    self.selected_keypoint.y = image_pos.y()
-                    self.selected_keypoint.visibility = 1
+                    keypoint.x = image_pos.x()
+                    keypoint.y = image_pos.y()
+                    keypoint.visibility = 1
 
-                    new_state = self.selected_keypoint.copy()
+                    new_state = keypoint.state()
                     self._push_keypoint_change(keypoint_index, old_state, new_state)
-                    self.update()
+                    self.update(
+                        self.keypoint_dirty_rect(keypoint_index, old_state, new_state)
+                    )
                     return
 
-            self.selected_keypoint = self.get_keypoint_at(event.pos())
-            if self.selected_keypoint:
+            previous_index = self.selected_index
+            self.selected_index = self.get_keypoint_at(event.pos())
+            if self.selected_index is not None:
+                keypoint = self.pose_data.keypoints[self.selected_index]
                 self.dragging = True
-                self.drag_start_pos = QPointF(
-                    self.selected_keypoint.x, self.selected_keypoint.y
-                )
-                self.keypoint_selected.emit(self.selected_keypoint.name)
-            self.update()
+                self.drag_start_pos = QPointF(keypoint.x, keypoint.y)
+            # 再次点中已选中的关键点（例如开始拖动）时，选中状态与画面都不变。
+            if self.selected_index != previous_index:
+                if self.selected_index is not None:
+                    self.keypoint_selected.emit(keypoint.name, self.selected_index)
+                self.update()
 
         elif event.button() == Qt.RightButton:
             self.panning = True
             self.last_pos = event.pos()
 
     def mouseMoveEvent(self, event: QMouseEvent):
-        if self.dragging and self.selected_keypoint:
-            image_pos = self.widget_to_image(event.pos())
-            self.selected_keypoint.x = image_pos.x()
-            self.selected_keypoint.y = image_pos.y()
-            self.update()
+        if self.dragging and self.selected_index is not None:
+            # 拖动时每次移动都会触发，直接用浮点运算换算坐标，不构造中间 QPointF。
+            keypoint = self.pose_data.keypoints[self.selected_index]
+            old_state = keypoint.state()
+            pos = event.position()
+            keypoint.x = (pos.x() - self.offset.x()) / self.scale
+            keypoint.y = (pos.y() - self.offset.y()) / self.scale
+            # 只重绘拖动前后标记及相连骨骼覆盖的区域；平移与缩放仍整体重绘。
+            self.update(
+                self.keypoint_dirty_rect(
+                    self.selected_index, old_state, keypoint.state()
+                )
+            )
         elif self.panning:
             delta = event.pos() - self.last_pos
             self.offset += delta
@@ -340,17 +575,17 @@ class Canvas(QWidget):
         if (
             event.button() == Qt.LeftButton
             and self.dragging
-            and self.selected_keypoint
+            and self.selected_index is not None
             and self.drag_start_pos
         ):
-            keypoint_index = self.pose_data.keypoints.index(self.selected_keypoint)
-            old_state = Keypoint(
-                self.selected_keypoint.name,
+            keypoint_index = self.selected_index
+            keypoint = self.pose_data.keypoints[keypoint_index]
+            old_state = (
                 self.drag_start_pos.x(),
                 self.drag_start_pos.y(),
-                self.selected_keypoint.visibility,
+                keypoint.visibility,
             )
-            new_state = self.selected_keypoint.copy()
+            new_state = keypoint.state()
             self._push_keypoint_change(keypoint_index, old_state, new_state)
             self.dragging = False
             self.drag_start_pos = None
@@ -378,23 +613,28 @@ class Canvas(QWidget):
             self.offset -= offset_delta
             self.update()
 
-    def keyPressEvent(self, event: QKeyEvent):
-        if not self.selected_keypoint:
+    def set_visibility(self, visibility: int):
+        """设置选中关键点的可见性（0: 遮挡, 1: 可见），并记录撤销。"""
+        keypoint_index = self.selected_index
+        if keypoint_index is None:
             return
-        key = event.key()
-        keypoint_index = self.pose_data.keypoints.index(self.selected_keypoint)
-        old_state = self.selected_keypoint.copy()
-
-        if key in [Qt.Key_S, Qt.Key_D, Qt.Key_Space]:
-            if key == Qt.Key_S:
-                self.selected_keypoint.visibility = 0
-            elif key == Qt.Key_D:
-                self.selected_keypoint.visibility = 1
-            elif key == Qt.Key_Space:
-                self.selected_keypoint.visibility = (
-                    1 - self.selected_keypoint.visibility
-                )
+        keypoint = self.pose_data.keypoints[keypoint_index]
+        old_state = keypoint.state()
+        keypoint.visibility = visibility
+        if self._push_keypoint_change(keypoint_index, old_state, keypoint.state()):
+            self.update(self.keypoint_dirty_rect(keypoint_index, keypoint.state()))
+
+    def toggle_visibility(self):
+        """切换选中关键点的可见性。"""
+        if self.selected_index is not None:
+            keypoint = self.pose_data.keypoints[self.selected_index]
+            self.set_visibility(1 - keypoint.visibility)
 
-            new_state = self.selected_keypoint.copy()
-            self._push_keypoint_change(keypoint_index, old_state, new_state)
-            self.update()
+    def keyPressEvent(self, event: QKeyEvent):
+        key = event.key()
+        if key == Qt.Key_S:
+            self.set_visibility(0)
+        elif key == Qt.Key_D:
+            self.set_visibility(1)
+        elif key == Qt.Key_Space:
+            self.toggle_visibility()
@@ -0,0 +1,54 @@
+"""关键点列表的数据模型。"""
+
+from typing import List, Optional
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QObject, Qt
+
+from ..models import Keypoint
+
+
+class KeypointListModel(QAbstractListModel):
+    """直接引用当前姿态的关键点列表，供 QListView 按需读取显示文本。"""
+
+    # 依次对应遮挡、可见。
+    PREFIXES = ("✕ ", "● ")
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._keypoints: List[Keypoint] = []
+
+    def set_keypoints(self, keypoints: List[Keypoint]):
+        """切换到新的关键点列表；仍是同一列表时只通知内容变化。"""
+        if keypoints is self._keypoints:
+            self.refresh()
+            return
+        self.beginResetModel()
+        self._keypoints = keypoints
+        self.endResetModel()
+
+    def refresh(self):
+        if self._keypoints:
+            self.dataChanged.emit(
+                self.index(0), self.index(len(self._keypoints) - 1), [Qt.DisplayRole]
+            )
+
+    def refresh_row(self, row: int):
+        """只通知单个关键点的显示内容变化。"""
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole])
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._keypoints)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            kp = self._keypoints[index.row()]
+            return self.PREFIXES[kp.visibility == 1] + kp.name
+        if role == Qt.UserRole:
+            # 关键点下标，调用方无需解析显示文本。
+            return index.row()
+        return None
@@ -1,14 +1,24 @@
 """延迟显示工具提示的辅助组件。"""
 
+from typing import Callable, Optional
+
 from PySide6.QtCore import QEvent, QObject, QTimer
 from PySide6.QtWidgets import QToolTip
 
 
 class DelayedTooltipFilter(QObject):
-    """事件过滤器：鼠标悬浮 2 秒后再显示工具提示。"""
+    """事件过滤器：鼠标悬浮 2 秒后再显示工具提示。
+
+    text_provider 可在显示时才按控件取得提示文本，默认读取控件自身的 toolTip()。
+    """
 
-    def __init__(self, parent=None):
+    def __init__(
+        self,
+        parent=None,
+        text_provider: Optional[Callable[[QObject], str]] = None,
+    ):
         super().__init__(parent)
+        self.text_provider = text_provider
         self.timer = QTimer(self)
         self.timer.setSingleShot(True)
         self.timer.setInterval(2000)  # 2秒延迟
@@ -18,9 +28,12 @@ class DelayedTooltipFilter(QObject):
 
     def _show_tooltip(self):
         if self.current_widget and self.global_pos:
-            QToolTip.showText(
-                self.global_pos, self.current_widget.toolTip(), self.current_widget
-            )
+            widget = self.current_widget
+            if self.text_provider is not None:
+                text = self.text_provider(widget)
+            else:
+                text = widget.toolTip()
+            QToolTip.showText(self.global_pos, text, widget)
 
     def eventFilter(self, obj, event):
         if event.type() == QEvent.Enter:
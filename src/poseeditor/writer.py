@@ -0,0 +1,101 @@
+"""在后台线程写入标注文件，避免保存时阻塞界面。"""
+
+import threading
+from typing import Callable, Dict, Optional, Tuple
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from .jsonio import write_bytes_atomic
+
+
+class _WriterSignals(QObject):
+    # 路径、写入序号、错误信息（成功时为空字符串）。
+    finished = Signal(str, int, str)
+
+
+class _WriteTask(QRunnable):
+    def __init__(
+        self,
+        path: str,
+        data: bytes,
+        serial: int,
+        signals: _WriterSignals,
+        is_latest: Callable[[str, int], bool],
+    ):
+        super().__init__()
+        self.path = path
+        self.data = data
+        self.serial = serial
+        self.signals = signals
+        self.is_latest = is_latest
+
+    def run(self):
+        # 排队期间同一路径又提交了新内容时直接跳过，由最新的任务写入。
+        if not self.is_latest(self.path, self.serial):
+            return
+        error = ""
+        try:
+            write_bytes_atomic(self.path, self.data)
+        except Exception as e:
+            error = str(e)
+        self.signals.finished.emit(self.path, self.serial, error)
+
+
+class JsonWriter(QObject):
+    """按提交顺序在单个后台线程中写文件。
+
+    写入完成前，pending() 可取得最新内容，读取方据此避免读到旧文件。
+    """
+
+    written = Signal(str)
+    failed = Signal(str, str)
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        # 单线程保证同一路径的多次写入按顺序落盘。
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._signals = _WriterSignals(self)
+        self._signals.finished.connect(self._on_finished)
+        self._serial = 0
+        # 路径 -> (最新写入序号, 内容)，只在主线程读写。
+        self._pending: Dict[str, Tuple[int, bytes]] = {}
+        # 路径 -> 最新写入序号，供后台任务判断自己是否已被取代。
+        self._latest: Dict[str, int] = {}
+        self._latest_lock = threading.Lock()
+
+    def write(self, path: str, data: bytes):
+        """提交写入；同一路径尚未执行的旧写入会被新内容取代。"""
+        self._serial += 1
+        self._pending[path] = (self._serial, data)
+        with self._latest_lock:
+            self._latest[path] = self._serial
+        self._pool.start(
+            _WriteTask(path, data, self._serial, self._signals, self._is_latest)
+        )
+
+    def _is_latest(self, path: str, serial: int) -> bool:
+        with self._latest_lock:
+            return self._latest.get(path) == serial
+
+    def pending(self, path: str) -> Optional[bytes]:
+        """返回尚未写完的最新内容；没有待写入内容时返回 None。"""
+        entry = self._pending.get(path)
+        return entry[1] if entry is not None else None
+
+    def flush(self):
+        """等待全部写入完成（导出与退出前调用）。"""
+        self._pool.waitForDone()
+
+    def _on_finished(self, path: str, serial: int, error: str):
+        entry = self._pending.get(path)
+        # 期间又提交了更新的内容时保留待写记录，等最后一次写完再清除。
+        if entry is not None and entry[0] == serial:
+            del self._pending[path]
+            with self._latest_lock:
+                if self._latest.get(path) == serial:
+                    del self._latest[path]
+        if error:
+            self.failed.emit(path, error)
+        else:
+            self.written.emit(path)
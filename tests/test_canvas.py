@@ -0,0 +1,34 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtGui import QColor, QImage
+from PySide6.QtWidgets import QApplication
+
+from poseeditor.widgets.canvas import Canvas
+
+
+def test_scaled_pixmap_matches_scale_near_fit() -> None:
+    app = QApplication.instance() or QApplication([])
+    canvas = Canvas()
+    canvas.resize(800, 600)
+    image = QImage(2000, 1500, QImage.Format_RGB32)
+    image.fill(QColor(200, 0, 0))
+    canvas.set_image(image)
+
+    dpr = canvas.devicePixelRatioF()
+
+    canvas.fit_to_window()
+    pixmap = canvas._scaled_pixmap()
+    assert pixmap is not None
+    assert pixmap.width() == round(2000 * canvas.scale * dpr)
+    assert pixmap.devicePixelRatio() == dpr
+
+    # 与适应比例只差一点的缩放不能复用适应比例的位图，否则图片与关键点错位。
+    canvas.scale *= 1.02
+    canvas._build_scaled_pixmap()
+    pixmap = canvas._scaled_pixmap()
+    assert pixmap is not None
+    assert pixmap.width() == round(2000 * canvas.scale * dpr)
+    assert pixmap.height() == round(1500 * canvas.scale * dpr)
+    app.processEvents()
@@ -0,0 +1,47 @@
+import pytest
+
+from poseeditor import jsonio
+from poseeditor.models import PoseData
+
+
+def test_write_and_read_annotation_roundtrip(tmp_path) -> None:
+    pose = PoseData()
+    pose.keypoints[5].x = 12.5
+    pose.keypoints[5].y = 33.0
+    pose.skip_reason = "美感不足"
+    path = tmp_path / "a.json"
+
+    jsonio.write_json(path, [pose.to_dict()])
+
+    raw = path.read_bytes()
+    assert "美感不足".encode("utf-8") in raw
+    loaded = PoseData.from_dict(jsonio.read_json(path)[0])
+    assert loaded.keypoints[5].x == 12.5
+    assert loaded.keypoints[5].y == 33.0
+    assert loaded.skip_reason == "美感不足"
+
+
+def test_stdlib_fallback_matches_format(monkeypatch) -> None:
+    monkeypatch.setattr(jsonio, "orjson", None)
+    data = {"skip_reason": "图像模糊", "keypoints": [[1.0, 2.0]]}
+
+    encoded = jsonio.dumps(data)
+
+    assert encoded.startswith(b'{\n  "skip_reason"')
+    assert jsonio.loads(encoded) == data
+
+
+def test_write_json_keeps_old_file_when_replace_fails(tmp_path, monkeypatch) -> None:
+    path = tmp_path / "a.json"
+    jsonio.write_json(path, {"v": 1})
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(jsonio.os, "replace", fail_replace)
+    with pytest.raises(OSError):
+        jsonio.write_json(path, {"v": 2})
+
+    # 替换失败时原文件保持完整，临时文件被清理。
+    assert jsonio.read_json(path) == {"v": 1}
+    assert list(tmp_path.iterdir()) == [path]
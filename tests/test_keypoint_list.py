@@ -0,0 +1,38 @@
+from PySide6.QtCore import Qt
+
+from poseeditor.models import PoseData
+from poseeditor.widgets.keypoint_list import KeypointListModel
+
+
+def test_keypoint_list_model_reads_live_keypoints() -> None:
+    pose = PoseData()
+    model = KeypointListModel()
+    model.set_keypoints(pose.keypoints)
+
+    assert model.rowCount() == len(PoseData.KEYPOINT_NAMES)
+    assert model.data(model.index(0), Qt.DisplayRole) == "✕ nose"
+    assert model.data(model.index(5), Qt.UserRole) == 5
+
+    changed = []
+    model.dataChanged.connect(
+        lambda first, last, _roles: changed.append((first.row(), last.row()))
+    )
+    pose.keypoints[0].visibility = 1
+    model.set_keypoints(pose.keypoints)
+
+    assert changed == [(0, len(pose.keypoints) - 1)]
+    assert model.data(model.index(0), Qt.DisplayRole) == "● nose"
+
+
+def test_keypoint_list_model_refreshes_single_row() -> None:
+    pose = PoseData()
+    model = KeypointListModel()
+    model.set_keypoints(pose.keypoints)
+    changed = []
+    model.dataChanged.connect(
+        lambda first, last, _roles: changed.append((first.row(), last.row()))
+    )
+
+    model.refresh_row(3)
+
+    assert changed == [(3, 3)]
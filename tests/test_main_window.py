@@ -0,0 +1,125 @@
+import json
+import os
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from PySide6.QtGui import QColor, QImage
+from PySide6.QtWidgets import QApplication, QMessageBox
+
+from poseeditor import main_window
+from poseeditor.constants import INDEX_FILE
+from poseeditor.main_window import PoseEditor
+
+# 比 PoseEditor.INDEX_MIN_AGE_NS 更早的目录修改时间，保证索引可以写入。
+_OLD_MTIME = time.time() - 60
+
+
+def _save_image(path) -> None:
+    image = QImage(40, 30, QImage.Format_RGB32)
+    image.fill(QColor(10, 20, 30))
+    image.save(str(path))
+
+
+def _make_project(root, names):
+    for sub in ("images", "annotations", "inpainting"):
+        (root / sub).mkdir()
+    for name in names:
+        _save_image(root / "images" / name)
+    os.utime(root / "images", (_OLD_MTIME, _OLD_MTIME))
+    return root
+
+
+def _open(window, root):
+    window.project_root = root
+    window.origin_dir = root / "images"
+    window.json_dir = root / "annotations"
+    window.inpaint_dir = root / "inpainting"
+    window._load_project()
+    window.annotation_writer.flush()
+
+
+@pytest.fixture
+def window(monkeypatch):
+    app = QApplication.instance() or QApplication([])
+    monkeypatch.setattr(QMessageBox, "information", lambda *args, **kwargs: None)
+    monkeypatch.setattr(QMessageBox, "warning", lambda *args, **kwargs: None)
+    window = PoseEditor()
+    yield window
+    window.close()
+    app.processEvents()
+
+
+def test_image_index_is_reused_while_folder_is_unchanged(window, tmp_path, monkeypatch):
+    root = _make_project(tmp_path, ["a.png", "b.png"])
+    _open(window, root)
+    assert [p.name for p in window.image_files] == ["a.png", "b.png"]
+    assert (root / INDEX_FILE).exists()
+
+    scan = main_window._iter_image_entries
+
+    def checked_scan(folder, *args, **kwargs):
+        assert folder != root / "images", "image folder was scanned"
+        return scan(folder, *args, **kwargs)
+
+    monkeypatch.setattr(main_window, "_iter_image_entries", checked_scan)
+    _open(window, root)
+
+    assert [p.name for p in window.image_files] == ["a.png", "b.png"]
+
+
+def test_image_index_is_rebuilt_when_folder_changes(window, tmp_path):
+    root = _make_project(tmp_path, ["a.png"])
+    _open(window, root)
+
+    _save_image(root / "images" / "b.png")
+    os.utime(root / "images", (_OLD_MTIME + 1, _OLD_MTIME + 1))
+    _open(window, root)
+
+    assert [p.name for p in window.image_files] == ["a.png", "b.png"]
+    index = json.loads((root / INDEX_FILE).read_text())
+    assert index["names"] == ["a.png", "b.png"]
+
+
+def test_unwritable_image_index_does_not_break_loading(window, tmp_path):
+    root = _make_project(tmp_path, ["a.png"])
+    # 索引路径被目录占用，写入必然失败。
+    (root / INDEX_FILE).mkdir()
+
+    _open(window, root)
+
+    assert [p.name for p in window.image_files] == ["a.png"]
+
+
+def test_annotation_cache_follows_file_changes(window, tmp_path):
+    path = tmp_path / "a.json"
+    path.write_text("[1]")
+
+    first = window._read_annotation(path)
+    assert window._read_annotation(path) is first
+
+    path.write_text("[22]")
+    os.utime(path, (_OLD_MTIME, _OLD_MTIME))
+
+    assert window._read_annotation(path) == [22]
+
+
+def test_clean_skim_does_not_rewrite_annotation(window, tmp_path, monkeypatch):
+    root = _make_project(tmp_path, ["a.png"])
+    annotation = root / "annotations" / "a.json"
+    annotation.write_text(json.dumps([{"keypoints": [[5, 5]] * 17}]))
+    _open(window, root)
+    written = []
+    monkeypatch.setattr(
+        window.annotation_writer, "write", lambda path, data: written.append(path)
+    )
+
+    window.save_current()
+    assert written == []
+    # 跳过写入的短暂停留不计入耗时，内存与文件保持一致。
+    assert window.canvas.pose_data.time_spent == 0.0
+
+    window.canvas.dirty = True
+    window.save_current()
+    assert written == [str(annotation)]
@@ -25,6 +25,22 @@ def test_pose_data_roundtrip_coco_format() -> None:
     assert loaded.person_fit == 4
 
 
+def test_pose_data_copy_is_independent() -> None:
+    pose = PoseData()
+    pose.keypoints[3].x = 5.0
+    pose.raw_scores = [0.9] * len(pose.keypoints)
+    pose.novelty = 2
+
+    copied = pose.copy()
+    copied.keypoints[3].x = 6.0
+    copied.raw_scores[0] = 0.1
+
+    assert len(copied.keypoints) == len(PoseData.KEYPOINT_NAMES)
+    assert copied.novelty == 2
+    assert pose.keypoints[3].x == 5.0
+    assert pose.raw_scores[0] == 0.9
+
+
 def test_pose_data_old_format_compatibility() -> None:
     old_payload = {
         "keypoints": [
@@ -43,22 +59,136 @@ def test_pose_data_old_format_compatibility() -> None:
 def test_undo_stack_for_keypoint_change() -> None:
     pose = PoseData()
     kp = pose.keypoints[0]
-    old_state = kp.copy()
+    old_state = kp.state()
 
     kp.x = 30.0
     kp.y = 40.0
     kp.visibility = 1
-    new_state = kp.copy()
+    new_state = kp.state()
 
     stack = UndoStack()
     stack.push(KeypointChangeCommand(pose, 0, old_state, new_state))
 
     assert stack.undo() is True
-    assert pose.keypoints[0].x == old_state.x
-    assert pose.keypoints[0].y == old_state.y
-    assert pose.keypoints[0].visibility == old_state.visibility
+    assert pose.keypoints[0].state() == old_state == (0, 0, 0)
 
     assert stack.redo() is True
-    assert pose.keypoints[0].x == new_state.x
-    assert pose.keypoints[0].y == new_state.y
-    assert pose.keypoints[0].visibility == new_state.visibility
+    assert pose.keypoints[0].state() == new_state == (30.0, 40.0, 1)
+
+
+def test_pose_data_bounding_box_ignores_unset_keypoints() -> None:
+    pose = PoseData()
+    assert pose.has_valid_keypoints() is False
+    assert pose.get_bounding_box() == (0, 0, 0, 0)
+
+    pose.keypoints[3].x, pose.keypoints[3].y = 50.0, 80.0
+    pose.keypoints[7].x, pose.keypoints[7].y = 20.0, 120.0
+    pose.keypoints[9].x, pose.keypoints[9].y = 0.5, 200.0  # x 未标注，忽略
+
+    assert pose.has_valid_keypoints() is True
+    assert pose.get_bounding_box() == (20.0, 80.0, 50.0, 120.0)
+
+
+def _move_keypoint(pose: PoseData, index: int, x: float, y: float) -> KeypointChangeCommand:
+    kp = pose.keypoints[index]
+    old_state = kp.state()
+    kp.x = x
+    kp.y = y
+    return KeypointChangeCommand(pose, index, old_state, kp.state())
+
+
+def test_undo_stack_merges_rapid_edits_of_same_keypoint() -> None:
+    pose = PoseData()
+    stack = UndoStack()
+
+    stack.push(_move_keypoint(pose, 0, 10.0, 10.0))
+    stack.push(_move_keypoint(pose, 0, 20.0, 20.0))
+    stack.push(_move_keypoint(pose, 1, 30.0, 30.0))
+
+    assert len(stack.undo_stack) == 2
+    assert stack.undo() is True
+    assert stack.undo() is True
+    assert pose.keypoints[0].x == 0
+    assert stack.undo() is False
+
+
+def test_undo_stack_is_bounded_and_merge_window_configurable() -> None:
+    pose = PoseData()
+    stack = UndoStack(max_depth=3, merge_window=0)
+
+    for i in range(5):
+        stack.push(_move_keypoint(pose, 0, float(i + 1), 0.0))
+
+    assert len(stack.undo_stack) == 3
+    while stack.undo():
+        pass
+    assert pose.keypoints[0].x == 2.0
+
+
+def test_undo_stack_drops_merged_edit_that_cancels_out() -> None:
+    pose = PoseData()
+    stack = UndoStack()
+
+    stack.push(_move_keypoint(pose, 2, 15.0, 15.0))
+    stack.push(_move_keypoint(pose, 2, 0, 0))
+
+    assert len(stack.undo_stack) == 0
+    assert stack.undo() is False
+
+
+def test_undo_stack_emits_only_on_state_transitions() -> None:
+    pose = PoseData()
+    stack = UndoStack(merge_window=0)
+    undo_events = []
+    redo_events = []
+    stack.can_undo_changed.connect(undo_events.append)
+    stack.can_redo_changed.connect(redo_events.append)
+
+    stack.push(_move_keypoint(pose, 0, 10.0, 10.0))
+    stack.push(_move_keypoint(pose, 1, 20.0, 20.0))
+    stack.undo()
+    stack.undo()
+    stack.redo()
+    stack.clear()
+
+    assert undo_events == [True, False, True, False]
+    assert redo_events == [True, False]
+
+
+def test_pose_needs_processing_until_scored_or_skipped() -> None:
+    pose = PoseData()
+    assert pose.needs_processing()
+
+    pose.novelty = 2
+    pose.environment_interaction = 3
+    assert pose.needs_processing()
+
+    pose.person_fit = 0
+    assert not pose.needs_processing()
+
+    skipped = PoseData()
+    skipped.skip_reason = "图像模糊"
+    assert not skipped.needs_processing()
+
+
+class _StubCanvas:
+    def __init__(self, pose: PoseData):
+        self.pose_data = pose
+        self.calls = []
+
+    def keypoint_dirty_rect(self, index, *states):
+        self.calls.append((index, states))
+        return "rect"
+
+
+def test_undo_reports_changed_region_for_current_pose_only() -> None:
+    pose = PoseData()
+    stack = UndoStack()
+    stack.push(_move_keypoint(pose, 4, 10.0, 20.0))
+
+    assert stack.undo() is True
+    canvas = _StubCanvas(pose)
+    assert stack.last_applied.changed_rect(canvas) == "rect"
+    assert canvas.calls == [(4, ((0, 0, 0), (10.0, 20.0, 0)))]
+    # 命令所属的姿态已不在画布上时，要求整体重绘。
+    assert stack.last_applied.changed_rect(_StubCanvas(PoseData())) is None
@@ -0,0 +1,69 @@
+import json
+import time
+
+from PySide6.QtCore import QCoreApplication
+from PySide6.QtGui import QColor, QImage
+
+from poseeditor.prefetch import ImagePrefetcher
+
+
+def _wait_until(app, condition, timeout=5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+
+
+def _save_image(path) -> str:
+    image = QImage(40, 30, QImage.Format_RGB32)
+    image.fill(QColor(10, 20, 30))
+    image.save(str(path))
+    return str(path)
+
+
+def test_prefetcher_keeps_only_most_recent_images() -> None:
+    prefetcher = ImagePrefetcher(capacity=2)
+    images = {name: QImage(4, 4, QImage.Format_RGB32) for name in "abc"}
+
+    prefetcher.put("a", images["a"])
+    prefetcher.put("b", images["b"])
+    assert prefetcher.get("a") is not None
+    prefetcher.put("c", images["c"])
+
+    # 访问过的 a 比 b 更新，超出容量时淘汰 b。
+    assert prefetcher.get("b") is None
+    assert prefetcher.get("a") is not None
+    assert prefetcher.get("c") is not None
+
+
+def test_prefetcher_loads_image_and_annotation_in_background(tmp_path) -> None:
+    app = QCoreApplication.instance() or QCoreApplication([])
+    prefetcher = ImagePrefetcher()
+    image_path = _save_image(tmp_path / "a.png")
+    annotation_path = tmp_path / "a.json"
+    annotation_path.write_text(json.dumps([{"novelty": 2}]))
+
+    prefetcher.prefetch([(image_path, str(annotation_path))])
+    _wait_until(app, lambda: prefetcher.get(image_path) is not None)
+
+    assert prefetcher.get(image_path).width() == 40
+    assert prefetcher.take_annotation(image_path) == (True, [{"novelty": 2}])
+    # 预读的标注只能取用一次。
+    assert prefetcher.take_annotation(image_path) == (False, None)
+    prefetcher.shutdown()
+
+
+def test_prefetcher_drops_annotation_written_while_loading(tmp_path) -> None:
+    app = QCoreApplication.instance() or QCoreApplication([])
+    prefetcher = ImagePrefetcher()
+    image_path = _save_image(tmp_path / "a.png")
+    annotation_path = tmp_path / "a.json"
+    annotation_path.write_text("[]")
+
+    prefetcher.prefetch([(image_path, str(annotation_path))])
+    prefetcher.discard_annotation(image_path)
+    _wait_until(app, lambda: prefetcher.get(image_path) is not None)
+
+    assert prefetcher.take_annotation(image_path) == (False, None)
+    prefetcher.shutdown()
+
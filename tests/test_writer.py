@@ -0,0 +1,57 @@
+import threading
+
+from PySide6.QtCore import QCoreApplication
+
+from poseeditor import writer as writer_module
+from poseeditor.writer import JsonWriter
+
+
+def test_json_writer_exposes_pending_until_written(tmp_path) -> None:
+    app = QCoreApplication.instance() or QCoreApplication([])
+    writer = JsonWriter()
+    written = []
+    writer.written.connect(written.append)
+    path = str(tmp_path / "a.json")
+
+    writer.write(path, b"[1]")
+    writer.write(path, b"[2]")
+    assert writer.pending(path) == b"[2]"
+
+    writer.flush()
+    app.processEvents()
+
+    assert (tmp_path / "a.json").read_bytes() == b"[2]"
+    assert writer.pending(path) is None
+    assert written and set(written) == {path}
+
+
+def test_json_writer_skips_superseded_queued_writes(tmp_path, monkeypatch) -> None:
+    app = QCoreApplication.instance() or QCoreApplication([])
+    writer = JsonWriter()
+    written = []
+    writer.written.connect(written.append)
+    path = str(tmp_path / "a.json")
+    blocker = str(tmp_path / "blocker.json")
+
+    # 写 blocker 时一直等待，占住唯一的写线程，使后续写入都在队列中等待。
+    release = threading.Event()
+    write_bytes_atomic = writer_module.write_bytes_atomic
+
+    def blocking_write(target, data):
+        if target == blocker:
+            release.wait(5)
+        write_bytes_atomic(target, data)
+
+    monkeypatch.setattr(writer_module, "write_bytes_atomic", blocking_write)
+    writer.write(blocker, b"[0]")
+    writer.write(path, b"[1]")
+    writer.write(path, b"[2]")
+    writer.write(path, b"[3]")
+    release.set()
+
+    writer.flush()
+    app.processEvents()
+
+    assert (tmp_path / "a.json").read_bytes() == b"[3]"
+    assert writer.pending(path) is None
+    assert written == [blocker, path]